@@ -0,0 +1,136 @@
+import math
+from array import array
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+# Array-backed counterparts of the list/dict helpers in exercise_smart_rewrites_completed.py
+
+Numbers = Union[np.ndarray, array, list]
+
+# find_first_even scans chunks that start small and double up to this size
+MAX_SEARCH_CHUNK = 1 << 20
+
+
+def as_array(values: Numbers) -> np.ndarray:
+    """
+    Returns values as a 1-D NumPy array, wrapping array.array buffers without copying.
+    """
+    if isinstance(values, array):
+        return np.frombuffer(values, dtype=values.typecode)
+    return np.asarray(values).ravel()
+
+
+def _is_even(values: np.ndarray) -> np.ndarray:
+    if np.issubdtype(values.dtype, np.integer):
+        return (values & 1) == 0
+    return values % 2 == 0
+
+
+def filter_even_numbers(values: Numbers) -> np.ndarray:
+    """
+    Returns the even values, in order.
+    """
+    values = as_array(values)
+    return values[_is_even(values)]
+
+
+def square_table(values: Numbers) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns (keys, squares) with the same entries as create_square_dict: each
+    distinct value once, in order of first appearance, with its square.
+
+    Integer squares are computed in int64 (uint64 for unsigned input). If a
+    square would not fit, keys and squares are returned as object arrays of
+    Python ints instead, so the result is always exact.
+    """
+    values = as_array(values)
+    _, first = np.unique(values, return_index=True)
+    keys = values[np.sort(first)]
+    if np.issubdtype(keys.dtype, np.integer):
+        wide = np.uint64 if np.issubdtype(keys.dtype, np.unsignedinteger) else np.int64
+        largest = max(abs(int(keys.min())), abs(int(keys.max()))) if len(keys) else 0
+        if largest > math.isqrt(int(np.iinfo(wide).max)):
+            keys = keys.astype(object)
+        else:
+            keys = keys.astype(wide)
+    return keys, keys * keys
+
+
+def find_first_even(values: Numbers, max_chunk: int = MAX_SEARCH_CHUNK) -> Optional[int]:
+    """
+    Returns the first even value, or None, scanning only as far as needed.
+
+    Chunks start at 1024 elements and double, so an early match costs little
+    while a long scan still runs at vectorised speed.
+    """
+    values = as_array(values)
+    start, size = 0, 1024
+    while start < len(values):
+        chunk = values[start:start + size]
+        hits = np.flatnonzero(_is_even(chunk))
+        if hits.size:
+            return chunk[hits[0]].item()
+        start += size
+        size = min(size * 2, max_chunk)
+    return None
+
+
+def calculate_average(values: Numbers, chunk_size: int = 1 << 20) -> float:
+    """
+    Returns the mean in one pass over the data (0 for no values, as calculate_average does).
+
+    Each chunk is summed pairwise in float64, and chunk means are folded into
+    a running mean weighted by count, which avoids the rounding error of one
+    huge running sum.
+    """
+    values = as_array(values)
+    mean = 0.0
+    count = 0
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start + chunk_size]
+        count += len(chunk)
+        mean += (float(chunk.mean(dtype=np.float64)) - mean) * len(chunk) / count
+    return mean
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    import exercise_smart_rewrites_completed as lists
+
+    # Check against the pure-Python helpers, then time both
+    rng = np.random.default_rng(0)
+    sample = rng.integers(-1000, 1000, 10_000)
+    python_sample = sample.tolist()
+    assert filter_even_numbers(sample).tolist() == lists.filter_even_numbers(python_sample)
+    keys, squares = square_table(sample)
+    assert dict(zip(keys.tolist(), squares.tolist())) == lists.create_square_dict(python_sample)
+    for large in ([2**40, -5], np.array([2**63 + 2, 3], dtype=np.uint64)):
+        keys, squares = square_table(large)
+        assert dict(zip(keys.tolist(), squares.tolist())) == lists.create_square_dict(list(map(int, large)))
+    assert find_first_even(sample) == lists.find_first_even(python_sample)
+    assert find_first_even(array('i', [1, 3, 5])) is None
+    assert np.isclose(calculate_average(sample), lists.calculate_average(python_sample))
+    assert calculate_average([]) == 0
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000_000
+    python_count = min(count, 1_000_000)
+    values = rng.integers(0, 1_000_000, count, dtype=np.int32) | 1
+    values[-1] = 2
+    python_values = values[:python_count].tolist()
+
+    print(f"{count:,} int32 values (pure Python timed on {python_count:,}, scaled up)")
+    for label, kernel, baseline in [
+        ('filter_even_numbers', filter_even_numbers, lists.filter_even_numbers),
+        ('square_table', square_table, lists.create_square_dict),
+        ('find_first_even', find_first_even, lists.find_first_even),
+        ('calculate_average', calculate_average, lists.calculate_average),
+    ]:
+        start = time.perf_counter()
+        kernel(values)
+        vectorised = time.perf_counter() - start
+        start = time.perf_counter()
+        baseline(python_values)
+        python = (time.perf_counter() - start) * count / python_count
+        print(f"  {label:<20} {vectorised:8.3f}s  (pure Python ~{python:.1f}s)")
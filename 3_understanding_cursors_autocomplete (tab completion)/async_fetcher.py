@@ -0,0 +1,222 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx # type: ignore
+
+# Responses worth retrying; anything else is returned as-is
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# Request errors that will fail the same way on every attempt
+PERMANENT_ERRORS = (httpx.UnsupportedProtocol, httpx.InvalidURL, httpx.DecodingError, httpx.TooManyRedirects, ValueError)
+
+
+@dataclass
+class FetchResult:
+    """
+    The outcome of fetching one URL.
+    """
+    url: str
+    status: Optional[int]
+    text: Optional[str]
+    elapsed: float
+    attempts: int = 0
+    from_cache: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status is not None and 200 <= self.status < 300
+
+
+class TTLCache:
+    """
+    An in-memory cache whose entries expire `ttl` seconds after being stored.
+    The oldest entries are evicted once it holds `max_entries`.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 10_000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Tuple[float, FetchResult]]' = OrderedDict()
+
+    def get(self, key: str) -> Optional[FetchResult]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: str, value: FetchResult) -> None:
+        if self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class ConcurrentFetcher:
+    """
+    Fetches many URLs concurrently over a pooled HTTP client.
+
+    At most `max_concurrency` requests are in flight overall and at most
+    `per_host_limit` per host. Failed requests (transport errors, timeouts and
+    RETRYABLE_STATUS responses) are retried with exponential backoff, and
+    successful responses are cached for `cache_ttl` seconds. Concurrent
+    requests for the same URL share a single fetch.
+
+    Use it as an async context manager so the connection pool is closed:
+
+        async with ConcurrentFetcher() as fetcher:
+            results = await fetcher.fetch_many(urls)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 100,
+        per_host_limit: int = 10,
+        timeout: float = 10.0,
+        retries: int = 2,
+        backoff: float = 0.1,
+        cache_ttl: float = 60.0,
+        cache_size: int = 10_000,
+    ):
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = TTLCache(cache_ttl, cache_size)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[str, 'asyncio.Future[FetchResult]'] = {}
+
+    async def __aenter__(self) -> 'ConcurrentFetcher':
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency),
+            timeout=httpx.Timeout(self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_semaphores[host]
+
+    async def fetch(self, url: str) -> FetchResult:
+        """
+        Fetches one URL, from the cache if possible. Errors are reported on
+        the result rather than raised.
+        """
+        cached = self.cache.get(url)
+        if cached is not None:
+            return FetchResult(cached.url, cached.status, cached.text, 0.0, 0, from_cache=True)
+        if url in self._in_flight:
+            return await asyncio.shield(self._in_flight[url])
+
+        future: 'asyncio.Future[FetchResult]' = asyncio.get_running_loop().create_future()
+        self._in_flight[url] = future
+        try:
+            result = await self._fetch_with_retries(url)
+            if result.ok:
+                self.cache.set(url, result)
+            future.set_result(result)
+            return result
+        except BaseException:
+            # Requests sharing this fetch see it as cancelled
+            future.cancel()
+            raise
+        finally:
+            del self._in_flight[url]
+
+    async def _fetch_with_retries(self, url: str) -> FetchResult:
+        if self._client is None:
+            raise RuntimeError("ConcurrentFetcher must be used with 'async with'")
+        start = time.perf_counter()
+        error: Optional[str] = None
+        status: Optional[int] = None
+        try:
+            host_semaphore = self._host_semaphore(url)
+        except ValueError as e:
+            return FetchResult(url, None, None, time.perf_counter() - start, 0, error=f"{type(e).__name__}: {e}")
+        for attempt in range(1, self.retries + 2):
+            if attempt > 1:
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 2))
+            # Wait for the host first, so requests queued on a busy host do not
+            # hold global slots that other hosts could use
+            async with host_semaphore, self._semaphore:
+                try:
+                    response = await self._client.get(url)
+                except PERMANENT_ERRORS as e:
+                    return FetchResult(url, None, None, time.perf_counter() - start, attempt, error=f"{type(e).__name__}: {e}")
+                except httpx.HTTPError as e:
+                    error, status = f"{type(e).__name__}: {e}", None
+                    continue
+            if response.status_code in RETRYABLE_STATUS:
+                error, status = f"HTTP {response.status_code}", response.status_code
+                continue
+            return FetchResult(url, response.status_code, response.text, time.perf_counter() - start, attempt)
+        return FetchResult(url, status, None, time.perf_counter() - start, self.retries + 1, error=error)
+
+    async def fetch_many(self, urls: Iterable[str]) -> List[FetchResult]:
+        """
+        Fetches every URL concurrently, returning results in the same order.
+        """
+        return await asyncio.gather(*(self.fetch(url) for url in urls))
+
+
+if __name__ == "__main__":
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    # Offline benchmark against a local stub server that takes 20ms per request
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            time.sleep(0.02)
+            body = f"Data from {self.path}".encode()
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base}/data/{i}" for i in range(400)]
+
+    async def run(concurrency: int, cache_ttl: float = 0.0) -> float:
+        async with ConcurrentFetcher(max_concurrency=concurrency, per_host_limit=concurrency, cache_ttl=cache_ttl) as fetcher:
+            start = time.perf_counter()
+            results = await fetcher.fetch_many(urls)
+            if cache_ttl:
+                start = time.perf_counter()
+                results = await fetcher.fetch_many(urls)
+            elapsed = time.perf_counter() - start
+        assert all(result.ok for result in results)
+        return len(urls) / elapsed
+
+    print(f"{len(urls)} requests to a stub server (20ms each)")
+    for concurrency in (1, 4, 16, 64):
+        print(f"  concurrency {concurrency:>3}  {asyncio.run(run(concurrency)):>10,.0f} requests/s")
+    print(f"  cached             {asyncio.run(run(64, cache_ttl=60)):>10,.0f} requests/s")
+    server.shutdown()
@@ -0,0 +1,172 @@
+import os
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd # type: ignore
+import pyarrow as pa # type: ignore
+import pyarrow.dataset as ds # type: ignore
+import pyarrow.feather as feather # type: ignore
+import pyarrow.parquet as pq # type: ignore
+
+# Low-cardinality text columns stored as dictionary-encoded categoricals
+CATEGORICAL_COLUMNS = ('Location', 'Department', 'City')
+
+# Row groups small enough that min/max statistics let filters skip whole groups
+ROW_GROUP_SIZE = 128_000
+
+FORMATS = {
+    '.parquet': 'parquet',
+    '.feather': 'feather',
+    '.arrow': 'feather',
+}
+
+# Filters use the pandas/pyarrow tuple style, e.g. [('Precipitation', '>', 0.5)]
+Filter = Tuple[str, str, object]
+
+
+def storage_format(path: str) -> str:
+    """
+    Returns the columnar format for a path based on its extension.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Unsupported columnar file extension: {extension!r} (use one of {', '.join(FORMATS)})")
+    return FORMATS[extension]
+
+
+def compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns a copy of the DataFrame with categorical text columns and the
+    smallest integer dtypes that hold each integer column.
+
+    Float columns become float32 only when every value survives the round
+    trip exactly; otherwise stored values (e.g. 0.7) would no longer compare
+    equal to the same literal in a filter.
+    """
+    df = df.copy()
+    for column in df.columns:
+        if column in CATEGORICAL_COLUMNS:
+            df[column] = df[column].astype('category')
+        elif pd.api.types.is_integer_dtype(df[column]):
+            df[column] = pd.to_numeric(df[column], downcast='integer')
+        elif pd.api.types.is_float_dtype(df[column]):
+            narrow = df[column].astype('float32')
+            if narrow.astype(df[column].dtype).equals(df[column]):
+                df[column] = narrow
+    return df
+
+
+def write_columnar(df: pd.DataFrame, path: str, compact: bool = True) -> None:
+    """
+    Writes a DataFrame to a Parquet (.parquet) or Feather (.feather/.arrow) file.
+
+    Args:
+    df (pd.DataFrame): The data to write.
+    path (str): The destination; its extension selects the format.
+    compact (bool): Whether to apply compact_dtypes before writing (default: True).
+    """
+    if compact:
+        df = compact_dtypes(df)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if storage_format(path) == 'parquet':
+        pq.write_table(table, path, row_group_size=ROW_GROUP_SIZE, compression='zstd')
+    else:
+        # Uncompressed Feather can be memory-mapped and read without copying
+        feather.write_feather(table, path, compression='uncompressed')
+
+
+def open_dataset(path: str) -> ds.Dataset:
+    """
+    Opens a Parquet or Feather file as a pyarrow dataset for scanning.
+    """
+    fmt = storage_format(path)
+    return ds.dataset(path, format='ipc' if fmt == 'feather' else fmt)
+
+
+def filter_expression(filters: Optional[Sequence[Filter]]) -> Optional[ds.Expression]:
+    """
+    Converts tuple-style filters (combined with "and") into a dataset expression.
+    """
+    if not filters:
+        return None
+    return pq.filters_to_expression(list(filters))
+
+
+def read_columnar(
+    path: str,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Sequence[Filter]] = None,
+) -> pd.DataFrame:
+    """
+    Reads a Parquet or Feather file into a DataFrame.
+
+    Args:
+    path (str): The file to read.
+    columns (list, optional): Only these columns are read from disk.
+    filters (list, optional): Row predicates such as [('Precipitation', '>', 0.5)].
+        For Parquet, row groups whose statistics cannot match are skipped
+        without being decoded.
+
+    Returns:
+    pd.DataFrame: The matching rows and columns.
+    """
+    table = open_dataset(path).to_table(columns=columns, filter=filter_expression(filters))
+    return table.to_pandas()
+
+
+def iter_columnar_batches(
+    path: str,
+    batch_size: int,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Sequence[Filter]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Reads a Parquet or Feather file as DataFrames of at most `batch_size` rows.
+    """
+    scanner = open_dataset(path).scanner(columns=columns, filter=filter_expression(filters), batch_size=batch_size)
+    for batch in scanner.to_batches():
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+
+if __name__ == "__main__":
+    import time
+    import numpy as np
+
+    # Benchmark the CSV round trip against Parquet and Feather for a rainy-day query
+    rows = 5_000_000
+    rng = np.random.default_rng(0)
+    weather = pd.DataFrame({
+        'Date': pd.date_range('2000-01-01', periods=rows, freq='min'),
+        'Temperature': rng.integers(-10, 45, rows),
+        'Humidity': rng.integers(20, 100, rows),
+        'Precipitation': rng.exponential(0.3, rows).round(2),
+        'WindSpeed': rng.integers(0, 40, rows),
+        'Location': rng.choice([f'City {i}' for i in range(100)], rows),
+    })
+
+    def timed(label, func):
+        start = time.perf_counter()
+        result = func()
+        print(f"  {label:<8} {time.perf_counter() - start:8.3f}s")
+        return result
+
+    def csv_query():
+        df = pd.read_csv('bench_weather.csv', parse_dates=['Date'])
+        return df.loc[df['Precipitation'] > 0.5, ['Date', 'Location', 'Precipitation']]
+
+    print(f"Writing {rows:,} rows")
+    timed('csv', lambda: weather.to_csv('bench_weather.csv', index=False))
+    timed('parquet', lambda: write_columnar(weather, 'bench_weather.parquet'))
+    timed('feather', lambda: write_columnar(weather, 'bench_weather.feather'))
+
+    print("Querying Precipitation > 0.5 for Date, Location, Precipitation")
+    query = dict(columns=['Date', 'Location', 'Precipitation'], filters=[('Precipitation', '>', 0.5)])
+    expected = timed('csv', csv_query)
+    for path in ('bench_weather.parquet', 'bench_weather.feather'):
+        result = timed(storage_format(path), lambda: read_columnar(path, **query))
+        assert len(result) == len(expected)
+
+    print("File sizes")
+    for path in ('bench_weather.csv', 'bench_weather.parquet', 'bench_weather.feather'):
+        print(f"  {path:<22} {os.path.getsize(path) / 1e6:8.1f} MB")
+        os.remove(path)
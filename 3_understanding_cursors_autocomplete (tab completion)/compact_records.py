@@ -0,0 +1,143 @@
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, overload
+
+# Slotted versions of the classes in exercise_smart_rewrites_completed.py.
+# Instances have no per-object __dict__, which saves most of their memory
+# when millions are held at once; public behaviour is unchanged.
+
+
+@dataclass(slots=True)
+class CompactPerson:
+    """
+    A person with a name and age, stored without a per-instance dict.
+    """
+    name: str
+    age: int
+
+    def __str__(self):
+        return f"{self.name} ({self.age})"
+
+
+class CompactVehicle:
+    __slots__ = ('make', 'model', 'year')
+
+    def __init__(self, make, model, year):
+        self.make = make
+        self.model = model
+        self.year = year
+
+
+class CompactCar(CompactVehicle):
+    # An empty __slots__ keeps subclasses dict-free too
+    __slots__ = ()
+
+    def display_info(self):
+        return f"{self.year} {self.make} {self.model}"
+
+
+@dataclass(slots=True)
+class CompactBankAccount:
+    _balance: float
+
+    def __init__(self, initial_balance: float):
+        self._balance = initial_balance
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+    @balance.setter
+    def balance(self, value):
+        if value < 0:
+            raise ValueError("Balance cannot be negative")
+        self._balance = value
+
+
+class PersonColumns:
+    """
+    Bulk storage for people as columns: a list of names and a packed array of
+    ages, so each person costs a list slot plus 4 bytes rather than an object.
+    """
+
+    def __init__(self, people: Iterable[CompactPerson] = ()):
+        self.names: List[str] = []
+        self.ages = array('i')
+        for person in people:
+            self.append(person.name, person.age)
+
+    def append(self, name: str, age: int) -> None:
+        # The packed array may reject the age, so add it first to keep the columns aligned
+        self.ages.append(age)
+        self.names.append(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @overload
+    def __getitem__(self, index: int) -> CompactPerson: ...
+    @overload
+    def __getitem__(self, index: slice) -> 'PersonColumns': ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            result = PersonColumns()
+            result.names = self.names[index]
+            result.ages = self.ages[index]
+            return result
+        return CompactPerson(self.names[index], self.ages[index])
+
+    def __iter__(self) -> Iterator[CompactPerson]:
+        for name, age in zip(self.names, self.ages):
+            yield CompactPerson(name, age)
+
+
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+    from exercise_smart_rewrites_completed import Car, Person
+
+    # Compare memory and attribute access for a million records of each kind
+    count = 1_000_000
+    names = [f"Person {i}" for i in range(count)]
+
+    def build(factory):
+        tracemalloc.start()
+        records = factory()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return records, peak
+
+    def read_ages(records):
+        start = time.perf_counter()
+        total = 0
+        for record in records:
+            total += record.age
+        return time.perf_counter() - start
+
+    print(f"{count:,} people (names allocated beforehand)")
+    for label, factory in [
+        ('Person', lambda: [Person(name, i % 90) for i, name in enumerate(names)]),
+        ('CompactPerson', lambda: [CompactPerson(name, i % 90) for i, name in enumerate(names)]),
+    ]:
+        records, peak = build(factory)
+        print(f"  {label:<14} {peak / 1e6:8.1f} MB  attribute reads {read_ages(records):.3f}s")
+
+    def build_columns():
+        columns = PersonColumns()
+        for i, name in enumerate(names):
+            columns.append(name, i % 90)
+        return columns
+
+    columns, peak = build(build_columns)
+    start = time.perf_counter()
+    sum(columns.ages)
+    print(f"  {'PersonColumns':<14} {peak / 1e6:8.1f} MB  column sum {time.perf_counter() - start:.3f}s")
+
+    print(f"{count:,} cars")
+    for label, factory in [
+        ('Car', lambda: [Car("Toyota", "Camry", 2000 + i % 25) for i in range(count)]),
+        ('CompactCar', lambda: [CompactCar("Toyota", "Camry", 2000 + i % 25) for i in range(count)]),
+    ]:
+        _, peak = build(factory)
+        print(f"  {label:<14} {peak / 1e6:8.1f} MB")
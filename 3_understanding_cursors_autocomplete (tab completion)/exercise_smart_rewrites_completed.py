@@ -46,8 +46,9 @@ def find_first_even(numbers: List[int]) -> Optional[int]:
     """
     Finds the first even number in the list.
     """
-    for num in numbers:
-        if (num := num % 2) == 0:
+    numbers_iter = iter(numbers)
+    while (num := next(numbers_iter, None)) is not None:
+        if num % 2 == 0:
             return num
     return None
 
@@ -149,7 +150,7 @@ def read_file_contents(filename):
 
 # TODO: Rewrite this function to use async/await
 async def fetch_data(url):
-    # Simulating network request
+    # Simulating network request (see async_fetcher.py for real concurrent fetching)
     import time
     await asyncio.sleep(1)
     return f"Data from {url}"
@@ -173,4 +174,4 @@ if __name__ == "__main__":
     car = Car("Toyota", "Camry", 2022)
     print(car.display_info())
     print(read_file_contents("example.txt"))
-    print(fetch_data("https://api.example.com/data"))
\ No newline at end of file
+    print(asyncio.run(fetch_data("https://api.example.com/data")))
\ No newline at end of file
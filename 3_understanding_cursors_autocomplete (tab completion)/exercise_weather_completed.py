@@ -1,7 +1,11 @@
-import pandas as pd # type: ignore
-import numpy as np
-import matplotlib.pyplot as plt
-from datetime import datetime
+import sys
+from typing import TYPE_CHECKING, Optional
+
+# pandas, pyarrow and matplotlib are imported inside the functions that use
+# them, so importing this module (or running it without --plot) stays cheap
+if TYPE_CHECKING:
+    import pandas as pd # type: ignore
+    from weather_streaming import WeatherSummary
 
 # Sample weather data
 data = {
@@ -15,32 +19,74 @@ data = {
                 'City B', 'City B', 'City B', 'City B', 'City B']
 }
 
-# Create a DataFrame
-df = pd.DataFrame(data)
 
-# Convert Date column to datetime
-df['Date'] = pd.to_datetime(df['Date'])
+def load_weather() -> 'pd.DataFrame':
+    """
+    Creates the sample weather DataFrame with a datetime Date column.
+    """
+    import pandas as pd # type: ignore
+
+    # Create a DataFrame
+    df = pd.DataFrame(data)
+
+    # Convert Date column to datetime
+    df['Date'] = pd.to_datetime(df['Date'])
+    return df
+
+
+def analyse_weather(df: 'pd.DataFrame', path: str = 'weather_data.parquet') -> 'WeatherSummary':
+    """
+    Saves the weather data and computes its statistics while reading it back.
+    """
+    from columnar_storage import write_columnar
+    from weather_streaming import summarise_weather_file
+
+    # Save the DataFrame to a Parquet file (categorical Location, compact numeric dtypes)
+    write_columnar(df, path)
+
+    # Read the file back in chunks, computing the statistics as each chunk arrives
+    return summarise_weather_file(path)
+
+
+def plot_temperature(df: 'pd.DataFrame', path: Optional[str] = None) -> None:
+    """
+    Plots temperature over time for each location, saving to `path` if given.
+    """
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    for location, readings in df.groupby('Location'):
+        ax.plot(readings['Date'], readings['Temperature'], marker='o', label=location)
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Temperature')
+    ax.legend()
+    fig.autofmt_xdate()
+    if path:
+        fig.savefig(path)
+    else:
+        plt.show()
+
+
+def main(plot: bool = False) -> None:
+    df = load_weather()
+    summary = analyse_weather(df)
+
+    # Calculate average temperature
+    avg_temp = summary.avg_temp
+    print(f"Average temperature: {avg_temp:.2f}")
 
-# Save the DataFrame to a CSV file
-df.to_csv('weather_data.csv', index=False)
+    # Find days with precipitation greater than 0.5
+    rainy_days = summary.rainy_days
+    print("\nRainy days:")
+    print(rainy_days)
 
-# Read the CSV file back into a DataFrame
-df = pd.read_csv('weather_data.csv')
-df['Date'] = pd.to_datetime(df['Date'])
+    # Group by location and calculate average weather metrics
+    location_stats = summary.location_stats
 
-# Calculate average temperature
-avg_temp = df['Temperature'].mean()
-print(f"Average temperature: {avg_temp:.2f}")
+    # Create a simple plot of temperature over time (only when asked for)
+    if plot:
+        plot_temperature(df)
 
-# Find days with precipitation greater than 0.5
-rainy_days = df[df['Precipitation'] > 0.5]
-print("\nRainy days:")
-print(rainy_days)
 
-# Group by location and calculate average weather metrics
-location_stats = df.groupby('Location').agg({
-    'Temperature': 'mean',
-    'Humidity': 'mean',
-    'Precipitation': 'sum',
-    'WindSpeed': 'mean'
-})
+if __name__ == "__main__":
+    main(plot='--plot' in sys.argv)
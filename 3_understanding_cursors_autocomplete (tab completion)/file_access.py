@@ -0,0 +1,194 @@
+import gzip
+import io
+import mmap
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional
+
+# Alternatives to read_file_contents for files too large to hold as one string
+
+GZIP_MAGIC = b'\x1f\x8b'
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def is_gzip(path: str) -> bool:
+    """
+    Checks the file's first bytes for the gzip signature.
+    """
+    with open(path, 'rb') as file:
+        return file.read(2) == GZIP_MAGIC
+
+
+def open_binary(path: str, decompress: Optional[bool] = None) -> BinaryIO:
+    """
+    Opens a file for reading bytes, decoding gzip transparently.
+
+    Args:
+    path (str): The file to open.
+    decompress (bool, optional): Whether to gunzip the file; by default this
+        is detected from its contents.
+    """
+    if decompress is None:
+        decompress = is_gzip(path)
+    if decompress:
+        return gzip.open(path, 'rb') # type: ignore
+    return open(path, 'rb')
+
+
+def iter_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, decompress: Optional[bool] = None) -> Iterator[bytes]:
+    """
+    Yields the (decompressed) contents of a file in chunks of at most `chunk_size` bytes.
+    """
+    with open_binary(path, decompress) as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def iter_lines(path: str, encoding: str = 'utf-8', decompress: Optional[bool] = None) -> Iterator[str]:
+    """
+    Yields the lines of a text file one at a time, including line endings.
+    """
+    with open_binary(path, decompress) as file:
+        with io.TextIOWrapper(file, encoding=encoding) as text:
+            yield from text
+
+
+@contextmanager
+def _mapping(path: str) -> Iterator[Optional[mmap.mmap]]:
+    if is_gzip(path):
+        raise ValueError(f"{path} is gzip-compressed; use iter_chunks or iter_lines instead")
+    with open(path, 'rb') as file:
+        try:
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            yield None
+            return
+        try:
+            yield mm
+        finally:
+            mm.close()
+
+
+@contextmanager
+def mapped(path: str) -> Iterator[memoryview]:
+    """
+    Memory-maps a file and yields a read-only memoryview of its bytes.
+
+    Slicing the view does not copy, and pages are read from disk only when
+    touched. Touched pages stay resident (as reclaimable page cache) while
+    the file is mapped; use iter_mapped_chunks for a single pass that keeps
+    resident memory bounded. Any slices taken from the view must be released
+    (or dropped) before the block exits.
+
+    Raises:
+    ValueError: If the file is gzip-compressed, since it cannot be mapped.
+    """
+    with _mapping(path) as mm:
+        view = memoryview(mm if mm is not None else b'')
+        try:
+            yield view
+        finally:
+            view.release()
+
+
+def iter_mapped_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[memoryview]:
+    """
+    Yields zero-copy memoryview slices of a memory-mapped file, each at most
+    `chunk_size` bytes. Each slice is only valid until the next one is requested.
+
+    Pages behind a slice are dropped from this process once the caller moves
+    on, so resident memory stays around one chunk however large the file is.
+
+    Raises:
+    ValueError: If the file is gzip-compressed, or chunk_size is not a
+        multiple of the page size.
+    """
+    if chunk_size % mmap.PAGESIZE:
+        raise ValueError(f"chunk_size must be a multiple of the page size ({mmap.PAGESIZE})")
+    with _mapping(path) as mm:
+        if mm is None:
+            return
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        view = memoryview(mm)
+        try:
+            for start in range(0, len(view), chunk_size):
+                chunk = view[start:start + chunk_size]
+                try:
+                    yield chunk
+                finally:
+                    chunk.release()
+                if hasattr(mmap, 'MADV_DONTNEED'):
+                    mm.madvise(mmap.MADV_DONTNEED, start, min(chunk_size, len(view) - start))
+        finally:
+            view.release()
+
+
+if __name__ == "__main__":
+    import json
+    import os
+    import resource
+    import subprocess
+    import sys
+    import tempfile
+    import time
+    import zlib
+
+    # Each mode runs in its own process so its peak RSS is measured in isolation
+    if len(sys.argv) == 3:
+        mode, path = sys.argv[1], sys.argv[2]
+        start = time.perf_counter()
+        size = 0
+        if mode == 'read_file_contents':
+            from exercise_smart_rewrites_completed import read_file_contents
+            size = len(read_file_contents(path))
+        elif mode == 'iter_chunks':
+            crc = 0
+            for chunk in iter_chunks(path):
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+        elif mode == 'iter_lines':
+            size = sum(len(line) for line in iter_lines(path))
+        elif mode == 'mapped':
+            with mapped(path) as view:
+                crc = zlib.crc32(view)
+                size = len(view)
+        elif mode == 'iter_mapped_chunks':
+            crc = 0
+            for chunk in iter_mapped_chunks(path):
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+        elapsed = time.perf_counter() - start
+        peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(json.dumps({'seconds': elapsed, 'bytes': size, 'peak_mb': peak_kb / 1024}))
+        sys.exit()
+
+    size_mb = 512
+    line = ("2023-01-01T00:00:00,City A,32.0,80.0,0.5,10.0\n" * 1000).encode()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'log.txt')
+        with open(path, 'wb') as file:
+            for _ in range(size_mb * (1 << 20) // len(line)):
+                file.write(line)
+        gz_path = path + '.gz'
+        with gzip.open(gz_path, 'wb', compresslevel=1) as target:
+            for chunk in iter_chunks(path):
+                target.write(chunk)
+
+        print(f"{os.path.getsize(path) / 1e6:.0f} MB log file")
+        here = os.path.dirname(os.path.abspath(__file__))
+        for mode, target_path in [
+            ('read_file_contents', path),
+            ('iter_chunks', path),
+            ('iter_lines', path),
+            ('mapped', path),
+            ('iter_mapped_chunks', path),
+            ('iter_chunks', gz_path),
+        ]:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), mode, target_path],
+                cwd=here, check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(output)
+            label = mode + (' (gzip)' if target_path == gz_path else '')
+            print(f"  {label:<20} {result['bytes'] / 1e6 / result['seconds']:8.0f} MB/s  peak RSS {result['peak_mb']:7.0f} MB")
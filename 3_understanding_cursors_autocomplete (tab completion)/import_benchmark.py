@@ -0,0 +1,46 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+
+# Each statement runs in a fresh interpreter so import caches never help
+STATEMENTS = {
+    'eager imports (previous header)': 'import pandas, numpy, matplotlib.pyplot, datetime',
+    'import exercise_weather_completed': 'import exercise_weather_completed',
+    'import main_completed': 'import main_completed',
+    'weather job without plot': (
+        'import os, tempfile, exercise_weather_completed as w; '
+        'w.analyse_weather(w.load_weather(), os.path.join(tempfile.mkdtemp(), "weather.parquet"))'
+    ),
+    'employee job': (
+        'import os, tempfile, main_completed as m; '
+        'm.load_employees(os.path.join(tempfile.mkdtemp(), "employees.parquet"))'
+    ),
+}
+
+
+def cold_start_times(statement: str, repeat: int = 5) -> List[float]:
+    """
+    Times `python -c statement` in new processes, returning seconds per run.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], cwd=here, check=True, capture_output=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+if __name__ == "__main__":
+    baseline = statistics.median(cold_start_times('pass'))
+    print(f"{'interpreter startup':<36} {baseline * 1000:8.1f} ms")
+    for label, statement in STATEMENTS.items():
+        try:
+            median = statistics.median(cold_start_times(statement))
+        except subprocess.CalledProcessError as e:
+            print(f"{label:<36} failed: {e.stderr.decode().strip().splitlines()[-1]}")
+            continue
+        print(f"{label:<36} {median * 1000:8.1f} ms  (+{(median - baseline) * 1000:.1f} ms)")
@@ -1,5 +1,8 @@
-import pandas as pd # type: ignore
-import numpy as np
+from typing import TYPE_CHECKING
+
+# pandas and pyarrow are imported when the analysis runs, not on import
+if TYPE_CHECKING:
+    import pandas as pd # type: ignore
 
 # Sample employee data, add 3 extra columns with random data: Experience, Bonus, and Department
 
@@ -13,37 +16,59 @@ data = {
     'Department': ['HR', 'Engineering', 'Marketing', 'Sales', 'Finance']
 }
 
-# Create a DataFrame
-df_temp = pd.DataFrame(data)
 
-# Save the DataFrame to a CSV file
-df_temp.to_csv('employee_data.csv', index=False)
+def load_employees(path: str = 'employee_data.parquet') -> 'pd.DataFrame':
+    """
+    Saves the sample employee data and reads it back.
+    """
+    import pandas as pd # type: ignore
+    from columnar_storage import read_columnar, write_columnar
+
+    # Create a DataFrame
+    df_temp = pd.DataFrame(data)
+
+    # Save the DataFrame to a Parquet file (categorical Department, compact numeric dtypes)
+    write_columnar(df_temp, path)
+
+    # Read the Parquet file back into a DataFrame
+    return read_columnar(path)
+
+
+def main() -> None:
+    from employee_query import summarise_employees
+
+    df_temp = load_employees()
+
+    # Perform operations on the DataFrame: the average age, high earners,
+    # department averages and oldest employees are planned as queries over
+    # one scan of the columns they need (see employee_query.py)
+    summary = summarise_employees(df_temp, salary_threshold=60000)
 
-# Read the CSV file back into a DataFrame
-df_temp = pd.read_csv('employee_data.csv')
+    # Calculate average age
+    avg_age = summary.avg_age
 
-# Perform operations on the DataFrame 
+    # Filter employees with salary greater than 60000
+    high_earners = summary.high_earners
 
-# Calculate average age
-avg_age = df_temp['Age'].mean()
+    # Group by department and calculate average salary
+    dept_avg_salary = summary.dept_avg_salary
 
-# Filter employees with salary greater than 60000
-high_earners = df_temp[df_temp['Salary'] > 60000]
+    # Sort DataFrame by age in descending order (only the oldest are kept)
+    df_sorted = summary.oldest
 
-# Group by department and calculate average salary
-dept_avg_salary = df_temp.groupby('Department')['Salary'].mean()
+    # Add a new column for bonus (10% of salary), computed by the summary's
+    # bonus plan in the same row order as df_temp
+    df_temp['Bonus'] = summary.bonuses['Bonus'].to_numpy()
+    # Display some information about the DataFrame
+    print(df_temp.head())
+    print("\nDataFrame Info:")
+    print(df_temp.info())
 
-# Sort DataFrame by age in descending order
-df_sorted = df_temp.sort_values(by='Age', ascending=False)
+    # Common DataFrame operations for practice:
 
-# Add a new column for bonus (10% of salary)
-df_temp['Bonus'] = df_temp['Salary'] * 0.1
-# Display some information about the DataFrame
-print(df_temp.head())
-print("\nDataFrame Info:")
-print(df_temp.info())
+    # Accessing a non-existent column (for error handling practice)
+    average_experience = df_temp['Experience'].mean()
 
-# Common DataFrame operations for practice:
 
-# Accessing a non-existent column (for error handling practice)
-average_experience = df_temp['Experience'].mean()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# How many offending positions a validation error lists
+MAX_REPORTED = 5
+
+
+def check_non_negative(name: str, values: np.ndarray) -> None:
+    """
+    Raises a ValueError describing every negative entry in one vectorised pass.
+
+    The message matches geometry_kernels.check_non_negative in the Cmd+K
+    exercises, so both array kernels report bad input the same way.
+
+    Raises:
+    ValueError: If any value is negative; the message gives the count and the
+        first few indices with their values.
+    """
+    negative = np.flatnonzero(values < 0)
+    if negative.size:
+        shown = ", ".join(f"{i} ({values.flat[i]})" for i in negative[:MAX_REPORTED])
+        more = f" and {negative.size - MAX_REPORTED} more" if negative.size > MAX_REPORTED else ""
+        raise ValueError(f"{name} must be non-negative; {negative.size} negative value(s) at indices {shown}{more}.")
+
+
+@dataclass
+class RectangleBatch:
+    """
+    Many rectangles stored as columns, the array counterpart of Rectangle.
+    """
+    width: np.ndarray
+    height: np.ndarray
+
+    def __post_init__(self):
+        self.width = np.asarray(self.width, dtype=np.float64)
+        self.height = np.asarray(self.height, dtype=np.float64)
+        if self.width.shape != self.height.shape or self.width.ndim != 1:
+            raise ValueError("width and height must be 1-D arrays of the same length")
+        check_non_negative("Widths", self.width)
+        check_non_negative("Heights", self.height)
+
+    @classmethod
+    def from_areas(cls, areas: ArrayLike) -> 'RectangleBatch':
+        """
+        Creates square rectangles with the given areas, like Rectangle.from_area.
+        """
+        areas = np.asarray(areas, dtype=np.float64)
+        check_non_negative("Areas", areas)
+        side = np.sqrt(areas)
+        return cls(side, side.copy())
+
+    def __len__(self) -> int:
+        return len(self.width)
+
+    def __getitem__(self, index: int):
+        from exercise_smart_rewrites_completed import Rectangle
+        return Rectangle(self.width[index].item(), self.height[index].item())
+
+    def area(self) -> np.ndarray:
+        return self.width * self.height
+
+
+if __name__ == "__main__":
+    import time
+    from exercise_smart_rewrites_completed import Rectangle
+
+    # Compare per-object Rectangle calls with the columnar batch at 10M shapes
+    count = 10_000_000
+    rng = np.random.default_rng(0)
+    areas = rng.uniform(0, 100, count)
+
+    start = time.perf_counter()
+    total = sum(Rectangle.from_area(area).area() for area in areas.tolist())
+    objects = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_total = RectangleBatch.from_areas(areas).area().sum()
+    batch = time.perf_counter() - start
+
+    assert np.isclose(total, batch_total)
+    print(f"{count:,} rectangles from areas")
+    print(f"  Rectangle       {objects:7.3f}s")
+    print(f"  RectangleBatch  {batch:7.3f}s")
@@ -0,0 +1,288 @@
+import math
+from array import array
+from itertools import islice
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+
+# A constant-memory alternative to calculate_average for streams and chunked data
+
+# Iterables that are not arrays are consumed in batches of this many values
+BATCH_SIZE = 1 << 16
+
+
+def _finite_values(values: np.ndarray) -> np.ndarray:
+    # NaN marks a missing value and is dropped; an infinity would break the
+    # moments and has no sketch bucket, so it is an error
+    finite = np.isfinite(values)
+    if finite.all():
+        return values
+    if np.isinf(values).any():
+        raise ValueError("Cannot summarise infinite values")
+    return values[finite]
+
+
+class QuantileSketch:
+    """
+    A mergeable sketch of a distribution that answers quantile queries to
+    within `relative_accuracy` of the true value (the DDSketch scheme).
+
+    Values are counted in logarithmically sized buckets, so memory grows with
+    the range of magnitudes seen rather than with the number of values.
+    NaN values are skipped and infinite values are rejected.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _add_buckets(self, buckets: Dict[int, int], magnitudes: np.ndarray) -> None:
+        indices = np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+        keys, counts = np.unique(indices, return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            buckets[key] = buckets.get(key, 0) + count
+
+    def add_many(self, values: np.ndarray) -> None:
+        """
+        Adds an array of values to the sketch, skipping NaN.
+
+        Raises:
+        ValueError: If any value is infinite; the sketch is left unchanged.
+        """
+        self._add_finite(_finite_values(np.asarray(values, dtype=np.float64)))
+
+    def _add_finite(self, values: np.ndarray) -> None:
+        positive = values[values > 0]
+        negative = values[values < 0]
+        self._add_buckets(self._positive, positive)
+        self._add_buckets(self._negative, -negative)
+        self.zero_count += len(values) - len(positive) - len(negative)
+        self.count += len(values)
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Adds another sketch's values to this one.
+
+        Raises:
+        ValueError: If the sketches were built with different accuracies.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for buckets, other_buckets in ((self._positive, other._positive), (self._negative, other._negative)):
+            for key, count in other_buckets.items():
+                buckets[key] = buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        return self
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns the approximate q-quantile, for q between 0 and 1.
+
+        Raises:
+        ValueError: If the sketch is empty or q is out of range.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            raise ValueError("Cannot take a quantile of no values")
+        rank = q * (self.count - 1)
+        seen = 0
+        # Walk buckets from the most negative value to the most positive
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._bucket_value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._bucket_value(key)
+        return self._bucket_value(max(self._positive))
+
+    def _bucket_value(self, key: int) -> float:
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+
+class StreamingStats:
+    """
+    Running count, mean, variance, min, max and quantiles of a stream of
+    numbers, in one pass and constant memory.
+
+    Single values are folded in with Welford's update and whole chunks with
+    Chan's parallel formula, so accumulators built in separate threads or
+    processes can be combined with merge() and give the same result as one
+    accumulator that saw every value.
+
+    NaN values are treated as missing: they are skipped and not counted.
+    Infinite values raise ValueError before the chunk they are in is added.
+
+        stats = StreamingStats()
+        for chunk in chunks:
+            stats.update_many(chunk)
+        print(stats.mean, stats.std, stats.quantile(0.99))
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def update(self, value: float) -> None:
+        """
+        Adds a single value; NaN is ignored.
+
+        Raises:
+        ValueError: If the value is infinite.
+        """
+        value = float(value)
+        if math.isnan(value):
+            return
+        if math.isinf(value):
+            raise ValueError("Cannot summarise infinite values")
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.sketch._add_finite(np.array([value]))
+
+    def update_many(self, values: Union[np.ndarray, array, Iterable[float]]) -> None:
+        """
+        Adds many values: a NumPy array or array.array is processed as one
+        chunk, and any other iterable in batches of BATCH_SIZE. NaN values
+        are skipped.
+
+        Raises:
+        ValueError: If a value is infinite. Batches of an iterable taken
+            before the one containing it have already been added.
+        """
+        if isinstance(values, array):
+            values = np.frombuffer(values, dtype=values.typecode)
+        if isinstance(values, np.ndarray):
+            self._update_chunk(values.ravel())
+            return
+        iterator = iter(values)
+        while True:
+            batch = np.fromiter(islice(iterator, BATCH_SIZE), dtype=np.float64)
+            if not len(batch):
+                return
+            self._update_chunk(batch)
+
+    def _update_chunk(self, chunk: np.ndarray) -> None:
+        chunk = _finite_values(chunk.astype(np.float64, copy=False))
+        if not len(chunk):
+            return
+        chunk_mean = float(chunk.mean())
+        chunk_m2 = float(np.square(chunk - chunk_mean).sum())
+        self._combine(len(chunk), chunk_mean, chunk_m2, float(chunk.min()), float(chunk.max()))
+        self.sketch._add_finite(chunk)
+
+    def _combine(self, count: int, mean: float, m2: float, minimum: float, maximum: float) -> None:
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = minimum if self.min is None else min(self.min, minimum)
+        self.max = maximum if self.max is None else max(self.max, maximum)
+
+    def merge(self, other: 'StreamingStats') -> 'StreamingStats':
+        """
+        Adds the values summarised by another accumulator and returns self.
+        """
+        if other.count:
+            self._combine(other.count, other.mean, other._m2, other.min, other.max) # type: ignore
+            self.sketch.merge(other.sketch)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """
+        The sample variance (n - 1 denominator), or nan with fewer than two values.
+        """
+        if self.count < 2:
+            return math.nan
+        return self._m2 / (self.count - 1)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns the approximate q-quantile, clamped to the exact min and max.
+        """
+        value = self.sketch.quantile(q)
+        return min(max(value, self.min), self.max) # type: ignore
+
+    def __repr__(self) -> str:
+        return (f"StreamingStats(count={self.count}, mean={self.mean:.6g}, std={self.std:.6g}, "
+                f"min={self.min}, max={self.max})")
+
+
+if __name__ == "__main__":
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    def summarise(seed: int) -> StreamingStats:
+        rng = np.random.default_rng(seed)
+        stats = StreamingStats()
+        for _ in range(10):
+            stats.update_many(rng.lognormal(3, 1, 1_000_000))
+        return stats
+
+    # Check against NumPy on data held in memory
+    rng = np.random.default_rng(0)
+    data = rng.normal(1e9, 5, 200_000)
+    stats = StreamingStats()
+    stats.update_many(data[:1000].tolist())
+    for value in data[1000:1100]:
+        stats.update(value)
+    stats.update_many(data[1100:])
+    assert np.isclose(stats.mean, data.mean(), rtol=0, atol=1e-6)
+    assert np.isclose(stats.variance, data.var(ddof=1), rtol=1e-6)
+    assert (stats.min, stats.max) == (data.min(), data.max())
+    for q in (0.01, 0.5, 0.99):
+        assert abs(stats.quantile(q) - np.quantile(data, q)) <= 0.01 * abs(np.quantile(data, q))
+
+    # NaN is skipped everywhere; infinities are rejected without changing anything
+    gappy = StreamingStats()
+    gappy.update_many(np.array([np.nan, 1.0, 3.0]))
+    gappy.update_many([np.nan, 5.0])
+    gappy.update(np.nan)
+    assert (gappy.count, gappy.mean, gappy.min, gappy.max) == (3, 3.0, 1.0, 5.0)
+    assert gappy.sketch.count == 3 and gappy.sketch.zero_count == 0
+    for bad in (np.array([2.0, np.inf]), [-np.inf]):
+        try:
+            gappy.update_many(bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("infinite values should be rejected")
+    assert (gappy.count, gappy.max, gappy.sketch.count) == (3, 5.0, 3)
+
+    # Summarise 4 streams of 10M values in separate processes and merge them
+    start = time.perf_counter()
+    with ProcessPoolExecutor() as pool:
+        parts = list(pool.map(summarise, range(4)))
+    total = StreamingStats()
+    for part in parts:
+        total.merge(part)
+    print(f"{total.count:,} values in {time.perf_counter() - start:.2f}s")
+    print(f"  {total}")
+    print("  p50 {:.2f}  p99 {:.2f}  (exact p50 {:.2f} for lognormal(3, 1))".format(
+        total.quantile(0.5), total.quantile(0.99), math.exp(3)))
@@ -0,0 +1,140 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd # type: ignore
+
+from weather_streaming import LOCATION_AGGREGATIONS, finalise_location_stats
+
+# Each worker process attaches to the shared input once, in _attach
+_shared = {}
+
+
+def _attach(values_name: str, codes_name: str, rows: int, columns: int) -> None:
+    values_block = shared_memory.SharedMemory(name=values_name)
+    codes_block = shared_memory.SharedMemory(name=codes_name)
+    _shared['blocks'] = (values_block, codes_block)
+    _shared['values'] = np.ndarray((columns, rows), dtype=np.float64, buffer=values_block.buf)
+    _shared['codes'] = np.ndarray((rows,), dtype=np.int32, buffer=codes_block.buf)
+
+
+def _aggregate_partition(bounds: Tuple[int, int], locations: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns per-location sums and non-null counts (one row per column) for rows [start, stop).
+
+    Rows without a location (code -1) are dropped and missing readings are
+    skipped, as groupby does.
+    """
+    start, stop = bounds
+    codes = _shared['codes'][start:stop]
+    values = _shared['values'][:, start:stop]
+    located = codes >= 0
+    codes, values = codes[located], values[:, located]
+    sums = np.zeros((len(values), locations))
+    counts = np.zeros((len(values), locations), dtype=np.int64)
+    for i, column in enumerate(values):
+        present = ~np.isnan(column)
+        sums[i] = np.bincount(codes[present], weights=column[present], minlength=locations)
+        counts[i] = np.bincount(codes[present], minlength=locations)
+    return sums, counts
+
+
+def _partitions(rows: int, count: int) -> List[Tuple[int, int]]:
+    edges = np.linspace(0, rows, count + 1, dtype=np.int64)
+    return [(int(start), int(stop)) for start, stop in zip(edges[:-1], edges[1:]) if stop > start]
+
+
+def parallel_location_stats(
+    df: pd.DataFrame,
+    workers: Optional[int] = None,
+    partitions: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Computes the per-location weather aggregates across a pool of processes.
+
+    The numeric columns and location codes are copied once into shared memory;
+    each worker aggregates a contiguous partition of rows into per-location sums
+    and non-null counts, and the partials are added together before the means
+    are taken, so the result matches a single-threaded groupby: missing readings
+    are skipped and rows with no Location are dropped.
+
+    Args:
+    df (pd.DataFrame): Weather data with a Location column and the columns in LOCATION_AGGREGATIONS.
+    workers (int, optional): The number of processes (default: the CPU count).
+    partitions (int, optional): The number of row partitions (default: 4 per worker).
+
+    Returns:
+    pd.DataFrame: One row per location, as in exercise_weather_completed.py.
+    """
+    workers = workers or os.cpu_count() or 1
+    partitions = partitions or workers * 4
+    codes, locations = pd.factorize(df['Location'], sort=True)
+    columns = list(LOCATION_AGGREGATIONS)
+    rows = len(df)
+    if rows == 0:
+        raise ValueError("Cannot aggregate an empty DataFrame")
+
+    values_block = shared_memory.SharedMemory(create=True, size=rows * len(columns) * 8)
+    codes_block = shared_memory.SharedMemory(create=True, size=rows * 4)
+    try:
+        values = np.ndarray((len(columns), rows), dtype=np.float64, buffer=values_block.buf)
+        for i, column in enumerate(columns):
+            values[i] = df[column].to_numpy(dtype=np.float64)
+        np.ndarray((rows,), dtype=np.int32, buffer=codes_block.buf)[:] = codes
+        del values
+
+        sums = np.zeros((len(columns), len(locations)))
+        counts = np.zeros((len(columns), len(locations)), dtype=np.int64)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach,
+            initargs=(values_block.name, codes_block.name, rows, len(columns)),
+        ) as pool:
+            bounds = _partitions(rows, partitions)
+            for partial_sums, partial_counts in pool.map(_aggregate_partition, bounds, [len(locations)] * len(bounds)):
+                sums += partial_sums
+                counts += partial_counts
+    finally:
+        values_block.close()
+        values_block.unlink()
+        codes_block.close()
+        codes_block.unlink()
+
+    index = pd.Index(np.asarray(locations, dtype=str), name='Location')
+    return finalise_location_stats(
+        pd.DataFrame(sums.T, index=index, columns=columns),
+        pd.DataFrame(counts.T, index=index, columns=columns),
+    )
+
+
+if __name__ == "__main__":
+    import time
+
+    # Compare the single-threaded groupby with the process pool at growing worker counts
+    rows = 20_000_000
+    rng = np.random.default_rng(0)
+    weather = pd.DataFrame({
+        'Temperature': rng.normal(30, 8, rows),
+        'Humidity': rng.uniform(40, 100, rows),
+        'Precipitation': rng.exponential(0.3, rows),
+        'WindSpeed': rng.uniform(0, 30, rows),
+        'Location': pd.Categorical(rng.integers(0, 5_000, rows).astype(str)),
+    })
+
+    start = time.perf_counter()
+    expected = weather.groupby('Location', observed=True).agg(LOCATION_AGGREGATIONS)
+    baseline = time.perf_counter() - start
+    print(f"{rows:,} rows, {len(expected):,} locations")
+    print(f"  groupby      {baseline:7.3f}s")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        result = parallel_location_stats(weather, workers=workers)
+        elapsed = time.perf_counter() - start
+        expected.index = expected.index.astype(str)
+        assert np.allclose(result.to_numpy(), expected.loc[result.index].to_numpy())
+        print(f"  {workers:>2} workers   {elapsed:7.3f}s  ({baseline / elapsed:.2f}x)")
+        workers *= 2
@@ -0,0 +1,175 @@
+import os
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+import pandas as pd # type: ignore
+
+# Explicit dtypes so each chunk is parsed straight into its final columns.
+# Measurements stay float64: float32 would shift values like 0.7 and the averages.
+WEATHER_DTYPES = {
+    'Temperature': 'float64',
+    'Humidity': 'float64',
+    'Precipitation': 'float64',
+    'WindSpeed': 'float64',
+    'Location': 'category',
+}
+
+# Per-location aggregation, matching the groupby step in exercise_weather_completed.py
+LOCATION_AGGREGATIONS = {
+    'Temperature': 'mean',
+    'Humidity': 'mean',
+    'Precipitation': 'sum',
+    'WindSpeed': 'mean',
+}
+
+RAINY_THRESHOLD = 0.5
+DEFAULT_CHUNKSIZE = 1_000_000
+
+
+def read_weather_chunks(path: str, chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """
+    Reads a weather CSV, Parquet or Feather file in chunks of at most `chunksize` rows.
+    """
+    if not path.lower().endswith('.csv'):
+        from columnar_storage import iter_columnar_batches
+        return iter_columnar_batches(path, chunksize)
+    return pd.read_csv(path, dtype=WEATHER_DTYPES, parse_dates=['Date'], chunksize=chunksize)
+
+
+def finalise_location_stats(sums: pd.DataFrame, counts: pd.DataFrame) -> pd.DataFrame:
+    """
+    Turns per-location sums and non-null counts (one column each) into the
+    LOCATION_AGGREGATIONS result. Missing readings are skipped, as groupby does.
+    """
+    stats = sums.copy()
+    for column, how in LOCATION_AGGREGATIONS.items():
+        if how == 'mean':
+            stats[column] = sums[column] / counts[column]
+    stats.index.name = 'Location'
+    return stats[list(LOCATION_AGGREGATIONS)].sort_index()
+
+
+@dataclass
+class WeatherPartial:
+    """
+    Mergeable partial aggregates for one or more chunks of weather data.
+    """
+    rows: int = 0
+    temperature_sum: float = 0.0
+    temperature_count: int = 0
+    location_sums: Optional[pd.DataFrame] = None
+    location_counts: Optional[pd.DataFrame] = None
+    rainy_days: List[pd.DataFrame] = field(default_factory=list)
+
+    @classmethod
+    def from_chunk(cls, chunk: pd.DataFrame, keep_rainy_days: bool = True) -> 'WeatherPartial':
+        # Sum in float64 so partials over billions of rows stay accurate
+        values = chunk[list(LOCATION_AGGREGATIONS)].astype('float64')
+        grouped = values.groupby(chunk['Location'], observed=True)
+        sums = grouped.sum()
+        sums.index = sums.index.astype(str)
+        # Non-null readings per column, so gaps in a station log do not dilute the means
+        counts = grouped.count()
+        counts.index = counts.index.astype(str)
+        rainy = chunk[chunk['Precipitation'] > RAINY_THRESHOLD]
+        return cls(
+            rows=len(chunk),
+            temperature_sum=float(values['Temperature'].sum()),
+            temperature_count=int(values['Temperature'].count()),
+            location_sums=sums,
+            location_counts=counts,
+            rainy_days=[rainy] if keep_rainy_days and not rainy.empty else [],
+        )
+
+    def merge(self, other: 'WeatherPartial') -> 'WeatherPartial':
+        """
+        Combines two partials; the result is the same as aggregating both inputs at once.
+        """
+        if self.location_sums is None:
+            return other
+        if other.location_sums is None:
+            return self
+        return WeatherPartial(
+            rows=self.rows + other.rows,
+            temperature_sum=self.temperature_sum + other.temperature_sum,
+            temperature_count=self.temperature_count + other.temperature_count,
+            location_sums=self.location_sums.add(other.location_sums, fill_value=0),
+            location_counts=self.location_counts.add(other.location_counts, fill_value=0),
+            rainy_days=self.rainy_days + other.rainy_days,
+        )
+
+    def summary(self) -> 'WeatherSummary':
+        if self.location_sums is None:
+            raise ValueError("No weather data has been aggregated")
+        rainy_days = pd.concat(self.rainy_days) if self.rainy_days else pd.DataFrame(columns=['Date', *WEATHER_DTYPES])
+        return WeatherSummary(
+            avg_temp=self.temperature_sum / self.temperature_count if self.temperature_count else float('nan'),
+            rainy_days=rainy_days,
+            location_stats=finalise_location_stats(self.location_sums, self.location_counts),
+            rows=self.rows,
+        )
+
+
+@dataclass
+class WeatherSummary:
+    avg_temp: float
+    rainy_days: pd.DataFrame
+    location_stats: pd.DataFrame
+    rows: int
+
+
+def summarise_weather_file(
+    path: str,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    rainy_days_path: Optional[str] = None,
+) -> WeatherSummary:
+    """
+    Computes the average temperature, rainy days and per-location stats of a
+    weather file in a single streaming pass.
+
+    Args:
+    path (str): The CSV, Parquet or Feather file to read.
+    chunksize (int): The number of rows held in memory at a time.
+    rainy_days_path (str, optional): If given, rainy days are appended to this
+        CSV file as they are found instead of being kept in memory, so memory
+        stays bounded however many rainy days there are.
+
+    Returns:
+    WeatherSummary: The merged result of every chunk.
+    """
+    if rainy_days_path is not None and os.path.exists(rainy_days_path):
+        os.remove(rainy_days_path)
+
+    total = WeatherPartial()
+    for chunk in read_weather_chunks(path, chunksize):
+        partial = WeatherPartial.from_chunk(chunk, keep_rainy_days=rainy_days_path is None)
+        if rainy_days_path is not None:
+            rainy = chunk[chunk['Precipitation'] > RAINY_THRESHOLD]
+            rainy.to_csv(rainy_days_path, mode='a', header=not os.path.exists(rainy_days_path), index=False)
+        total = total.merge(partial)
+    return total.summary()
+
+
+if __name__ == "__main__":
+    import time
+    import numpy as np
+
+    # Write a synthetic station log and stream it back in small chunks
+    rows = 2_000_000
+    rng = np.random.default_rng(0)
+    pd.DataFrame({
+        'Date': pd.date_range('2000-01-01', periods=rows, freq='min'),
+        'Temperature': rng.normal(30, 8, rows).round(1),
+        'Humidity': rng.uniform(40, 100, rows).round(1),
+        'Precipitation': rng.exponential(0.3, rows).round(2),
+        'WindSpeed': rng.uniform(0, 30, rows).round(1),
+        'Location': rng.choice([f'City {i}' for i in range(50)], rows),
+    }).to_csv('weather_stream_demo.csv', index=False)
+
+    start = time.perf_counter()
+    summary = summarise_weather_file('weather_stream_demo.csv', chunksize=250_000)
+    print(f"Streamed {summary.rows:,} rows in {time.perf_counter() - start:.2f}s")
+    print(f"Average temperature: {summary.avg_temp:.2f}")
+    print(f"Rainy days: {len(summary.rainy_days):,}")
+    print(summary.location_stats.head())
+    os.remove('weather_stream_demo.csv')
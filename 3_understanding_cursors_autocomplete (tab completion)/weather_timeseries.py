@@ -0,0 +1,163 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd # type: ignore
+
+WEATHER_COLUMNS = ['Temperature', 'Humidity', 'Precipitation', 'WindSpeed']
+
+
+def add_feels_like(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds the "feels_like" temperature (temperature - wind_speed/5) to a copy of the DataFrame.
+    """
+    df = df.copy()
+    df['feels_like'] = df['Temperature'] - df['WindSpeed'] / 5
+    return df
+
+
+class IncrementalWeatherSeries:
+    """
+    Maintains weekly averages and rolling-window means for weather readings
+    as new rows are appended, without re-resampling the full history.
+
+    Only the weeks touched by new rows are updated, and only the readings
+    that can still fall inside a rolling window are kept from the history.
+    """
+
+    def __init__(self, window: str = '7D', week: str = 'W-SUN', group_by: str = 'Location'):
+        self.window = pd.Timedelta(window)
+        self.week = week
+        self.group_by = group_by
+        self.columns = WEATHER_COLUMNS + ['feels_like']
+        # (group, week end) -> per-column sums and counts
+        self._weekly: Dict[Tuple[str, pd.Timestamp], Tuple[np.ndarray, np.ndarray]] = {}
+        # Recent readings per group that later rows' windows can still reach
+        self._recent = pd.DataFrame()
+
+    def append(self, rows: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adds new readings and returns them with feels_like and rolling mean columns.
+
+        Args:
+        rows (pd.DataFrame): Readings with a Date column, the group column and
+            WEATHER_COLUMNS. Within each group they must not be older than the
+            readings already appended.
+
+        Returns:
+        pd.DataFrame: The new rows, in their original order, with a
+            `<column>_rolling` column for each tracked column.
+        """
+        if rows.empty:
+            return rows
+        new = add_feels_like(rows)
+        new['Date'] = pd.to_datetime(new['Date'])
+        self._check_order(new)
+        self._update_weekly(new)
+        rolling = self._update_rolling(new)
+        # Assign by position so duplicate index labels in `rows` are harmless
+        for i, column in enumerate(self.columns):
+            new[f'{column}_rolling'] = rolling[:, i]
+        return new
+
+    def weekly_averages(self) -> pd.DataFrame:
+        """
+        Returns the average of each column per group and week (labelled by the
+        week's last day, as resample('W') does). Weeks without readings are omitted.
+        """
+        keys = sorted(self._weekly)
+        averages: List[np.ndarray] = []
+        for key in keys:
+            sums, counts = self._weekly[key]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                averages.append(sums / counts)
+        index = pd.MultiIndex.from_tuples(keys, names=[self.group_by, 'Date'])
+        return pd.DataFrame(averages, index=index, columns=self.columns)
+
+    def _check_order(self, new: pd.DataFrame) -> None:
+        if self._recent.empty:
+            return
+        latest = self._recent.groupby(self.group_by, observed=True)['Date'].max()
+        earliest = new.groupby(self.group_by, observed=True)['Date'].min()
+        common = earliest.index.intersection(latest.index)
+        stale = earliest[common] < latest[common]
+        if stale.any():
+            raise ValueError(f"Rows for {', '.join(map(str, stale[stale].index))} are older than readings already appended")
+
+    def _update_weekly(self, new: pd.DataFrame) -> None:
+        week_end = new['Date'].dt.to_period(self.week).dt.end_time.dt.normalize()
+        grouped = new[self.columns].groupby([new[self.group_by], week_end], observed=True)
+        sums = grouped.sum()
+        counts = grouped.count()
+        for key, row_sums, row_counts in zip(sums.index, sums.to_numpy(), counts.to_numpy()):
+            if key in self._weekly:
+                total_sums, total_counts = self._weekly[key]
+                self._weekly[key] = (total_sums + row_sums, total_counts + row_counts)
+            else:
+                self._weekly[key] = (row_sums, row_counts)
+
+    def _update_rolling(self, new: pd.DataFrame) -> np.ndarray:
+        groups = new[self.group_by].unique()
+        recent = self._recent
+        if not recent.empty:
+            recent = recent[recent[self.group_by].isin(groups)]
+        combined = pd.concat([recent, new[['Date', self.group_by] + self.columns]], ignore_index=True)
+        combined['_new_position'] = np.concatenate([np.full(len(recent), -1), np.arange(len(new))])
+        combined = combined.sort_values([self.group_by, 'Date'], kind='stable')
+
+        # Rows are contiguous per group and in date order, so the rolling
+        # output lines up with `combined` row for row
+        rolling = (
+            combined.groupby(self.group_by, observed=True, sort=False)
+            .rolling(self.window, on='Date')[self.columns]
+            .mean()
+        )
+        positions = combined['_new_position'].to_numpy()
+        is_new = positions >= 0
+        # One row per new reading, in the order of `new`
+        result = np.empty((len(new), len(self.columns)))
+        result[positions[is_new]] = rolling.to_numpy()[is_new]
+
+        # Keep only readings inside the window of each group's latest reading
+        combined = combined.drop(columns='_new_position')
+        latest = combined.groupby(self.group_by, observed=True)['Date'].transform('max')
+        kept = combined[combined['Date'] > latest - self.window]
+        untouched = self._recent[~self._recent[self.group_by].isin(groups)] if not self._recent.empty else self._recent
+        self._recent = pd.concat([untouched, kept], ignore_index=True)
+        return result
+
+
+if __name__ == "__main__":
+    import time
+
+    # Feed a year of hourly readings one day at a time and compare with a full recompute
+    stations = [f'Station {i}' for i in range(20)]
+    dates = pd.date_range('2023-01-01', periods=24 * 365, freq='h')
+    rng = np.random.default_rng(0)
+    readings = pd.DataFrame({
+        'Date': np.repeat(dates, len(stations)),
+        'Location': np.tile(stations, len(dates)),
+        'Temperature': rng.normal(30, 8, len(dates) * len(stations)),
+        'Humidity': rng.uniform(40, 100, len(dates) * len(stations)),
+        'Precipitation': rng.exponential(0.3, len(dates) * len(stations)),
+        'WindSpeed': rng.uniform(0, 30, len(dates) * len(stations)),
+    })
+    days = [day for _, day in readings.groupby(readings['Date'].dt.date)]
+
+    series = IncrementalWeatherSeries()
+    start = time.perf_counter()
+    for day in days:
+        series.append(day)
+    incremental = time.perf_counter() - start
+
+    start = time.perf_counter()
+    history = add_feels_like(days[0])
+    for day in days[1:]:
+        history = pd.concat([history, add_feels_like(day)])
+        weekly = history.set_index('Date').groupby('Location')[series.columns].resample('W').mean()
+        history.groupby('Location').rolling('7D', on='Date')[series.columns].mean()
+    recompute = time.perf_counter() - start
+
+    assert np.allclose(series.weekly_averages().to_numpy(), weekly.dropna().to_numpy())
+    print(f"{len(days)} daily appends of {len(days[0]):,} rows")
+    print(f"  incremental  {incremental:7.2f}s")
+    print(f"  recompute    {recompute:7.2f}s")
@@ -0,0 +1,137 @@
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import numpy as np
+
+import bulk_passwords
+import exercise_complete
+from geometry_kernels import calculate_areas
+from greeting_renderer import GreetingRenderer
+
+
+def measure(func: Callable[[], object]) -> Tuple[float, int]:
+    """
+    Run func once, returning (seconds, peak bytes allocated while it ran).
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def fibonacci_list(n: int) -> int:
+    """
+    The previous dynamic-programming fibonacci, kept as a baseline.
+    """
+    if n <= 1:
+        return n
+    fib = [0] * (n + 1)
+    fib[1] = 1
+    for i in range(2, n + 1):
+        fib[i] = fib[i-1] + fib[i-2]
+    return fib[n]
+
+
+def benchmark_fibonacci(max_exponent: int) -> None:
+    print(f"{'n':>12} {'fast doubling':>14} {'peak memory':>12} {'list DP':>10} {'peak memory':>12}")
+    for exponent in range(1, max_exponent + 1):
+        n = 10 ** exponent
+        exercise_complete._cached_fibonacci_pair.cache_clear()
+        doubling_time, doubling_peak = measure(lambda: exercise_complete.fibonacci(n))
+        row = f"{n:>12,} {doubling_time:>13.4f}s {doubling_peak / 1e6:>10.2f}MB"
+        # The list-based version needs O(n^2) bits of memory, so stop early
+        if exponent <= 5:
+            list_time, list_peak = measure(lambda: fibonacci_list(n))
+            row += f" {list_time:>9.4f}s {list_peak / 1e6:>10.2f}MB"
+        print(row)
+
+    # Peak memory shows the intermediate numbers; what the cache still holds
+    # afterwards should stay small however large the indices were
+    for label, batch in [
+        ('fibonacci_batch(100000 .. 100299)', lambda: exercise_complete.fibonacci_batch(range(100_000, 100_300))),
+        ('fibonacci_range(0, 100000)', lambda: exercise_complete.fibonacci_range(0, 100_000)),
+    ]:
+        exercise_complete._cached_fibonacci_pair.cache_clear()
+        tracemalloc.start()
+        start = time.perf_counter()
+        total = sum(1 for _ in batch())
+        elapsed = time.perf_counter() - start
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label}: {total:,} values in {elapsed:.3f}s, "
+              f"peak {peak / 1e6:.2f}MB, retained {retained / 1e6:.2f}MB")
+
+
+def benchmark_passwords(count: int) -> None:
+    policy = bulk_passwords.PasswordPolicy(length=12)
+    start = time.perf_counter()
+    for _ in range(count):
+        exercise_complete.generate_password(policy.length)
+    single = time.perf_counter() - start
+    start = time.perf_counter()
+    bulk_passwords.generate_passwords(count, policy)
+    bulk = time.perf_counter() - start
+    print(f"{count:,} passwords of length {policy.length}")
+    print(f"  generate_password   {count / single:>12,.0f} passwords/s")
+    print(f"  generate_passwords  {count / bulk:>12,.0f} passwords/s")
+
+
+def benchmark_greetings(count: int) -> None:
+    recipients = [f"Person {i}" if i % 3 else (f"Person {i}", f"Friend {i}") for i in range(count)]
+    start = time.perf_counter()
+    expected = [
+        exercise_complete.greet(recipient, language='fr') if isinstance(recipient, str)
+        else exercise_complete.greet(*recipient, language='fr')
+        for recipient in recipients
+    ]
+    single = time.perf_counter() - start
+    start = time.perf_counter()
+    rendered = list(GreetingRenderer().render_many(recipients, language='fr'))
+    batch = time.perf_counter() - start
+    assert rendered == expected
+    print(f"{count:,} greetings")
+    print(f"  greet        {count / single:>12,.0f} messages/s")
+    print(f"  render_many  {count / batch:>12,.0f} messages/s")
+
+
+def benchmark_areas(count: int) -> None:
+    rng = np.random.default_rng(0)
+    lengths = rng.uniform(0, 100, count)
+    widths = rng.uniform(0, 100, count)
+    start = time.perf_counter()
+    expected = [exercise_complete.calculate_area(l, w) for l, w in zip(lengths.tolist(), widths.tolist())]
+    single = time.perf_counter() - start
+    start = time.perf_counter()
+    areas = calculate_areas(lengths, widths)
+    batch = time.perf_counter() - start
+    assert np.allclose(areas, expected)
+    print(f"{count:,} rectangles")
+    print(f"  calculate_area   {single:8.3f}s")
+    print(f"  calculate_areas  {batch:8.3f}s")
+
+
+BENCHMARKS = {
+    'fibonacci': lambda args: benchmark_fibonacci(args.max_exponent),
+    'passwords': lambda args: benchmark_passwords(args.count),
+    'greetings': lambda args: benchmark_greetings(args.count),
+    'areas': lambda args: benchmark_areas(args.count),
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks for exercise_complete.py")
+    parser.add_argument('benchmarks', nargs='*', help=f"benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument('--max-exponent', type=int, default=7, help="fibonacci sizes go up to 10**max_exponent (use 8 for 10^8)")
+    parser.add_argument('--count', type=int, default=1_000_000, help="number of items for the batch benchmarks")
+    args = parser.parse_args()
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    for name in args.benchmarks or BENCHMARKS:
+        print(f"== {name}")
+        BENCHMARKS[name](args)
@@ -0,0 +1,120 @@
+import secrets
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+LOWERCASE = "abcdefghijklmnopqrstuvwxyz"
+UPPERCASE = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+DIGITS = "0123456789"
+SPECIAL = "!@#$%^&*"
+
+# Random bytes are requested from the OS in blocks of at least this size
+BLOCK_BYTES = 1 << 16
+
+
+@dataclass(frozen=True)
+class PasswordPolicy:
+    """
+    A password length and the character classes that must each appear at least once.
+    """
+    length: int = 12
+    character_classes: Tuple[str, ...] = (LOWERCASE, UPPERCASE, DIGITS, SPECIAL)
+
+    def __post_init__(self):
+        # An empty class can never be satisfied, so generation would never finish
+        if not self.character_classes or not all(self.character_classes):
+            raise ValueError("Character classes must each contain at least one character.")
+        if self.length < len(self.character_classes):
+            raise ValueError("Length must be at least the number of required character classes.")
+        alphabet = ''.join(self.character_classes)
+        if len(set(alphabet)) != len(alphabet):
+            raise ValueError("Character classes must not overlap or repeat characters.")
+        if not alphabet.isascii() or not 1 < len(alphabet) <= 256:
+            raise ValueError("Character classes must contain 2 to 256 ASCII characters in total.")
+
+    @property
+    def alphabet(self) -> str:
+        return ''.join(self.character_classes)
+
+
+def _random_indices(count: int, alphabet_size: int) -> np.ndarray:
+    """
+    Draw `count` uniform indices in [0, alphabet_size) from the OS CSPRNG.
+
+    Bytes at or above the largest multiple of alphabet_size are rejected rather
+    than reduced, so the modulo introduces no bias.
+    """
+    limit = 256 - 256 % alphabet_size
+    chunks = []
+    remaining = count
+    while remaining > 0:
+        # Over-draw by the expected rejection rate so one block usually suffices
+        size = max(BLOCK_BYTES, int(remaining * 256 / limit * 1.05) + 64)
+        raw = np.frombuffer(secrets.token_bytes(size), dtype=np.uint8)
+        accepted = raw[raw < limit][:remaining]
+        chunks.append(accepted % alphabet_size)
+        remaining -= len(accepted)
+    return np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
+
+
+def generate_passwords(count: int, policy: PasswordPolicy = PasswordPolicy()) -> List[str]:
+    """
+    Generate passwords in bulk using a cryptographically secure random source.
+
+    Whole passwords are drawn uniformly from the policy's alphabet, and any
+    that miss a required character class are redrawn, so every password that
+    meets the policy is equally likely.
+
+    Args:
+    count (int): The number of passwords to generate.
+    policy (PasswordPolicy): The length and required character classes.
+
+    Returns:
+    List[str]: `count` passwords that each satisfy the policy.
+    """
+    if count < 0:
+        raise ValueError("Count must be non-negative.")
+    if count == 0:
+        return []
+    alphabet = policy.alphabet
+    characters = np.frombuffer(alphabet.encode('ascii'), dtype=np.uint8)
+    class_of = np.repeat(np.arange(len(policy.character_classes)), [len(c) for c in policy.character_classes])
+
+    accepted = []
+    needed = count
+    while needed > 0:
+        indices = _random_indices(needed * policy.length, len(alphabet)).reshape(needed, policy.length)
+        classes = class_of[indices]
+        valid = np.ones(needed, dtype=bool)
+        for class_id in range(len(policy.character_classes)):
+            valid &= (classes == class_id).any(axis=1)
+        accepted.append(indices[valid])
+        needed -= int(valid.sum())
+
+    text = characters[np.concatenate(accepted)].tobytes().decode('ascii')
+    return [text[i:i + policy.length] for i in range(0, len(text), policy.length)]
+
+
+def iter_passwords(policy: PasswordPolicy = PasswordPolicy(), batch_size: int = 10_000) -> Iterator[str]:
+    """
+    Yield passwords indefinitely, generating them `batch_size` at a time.
+    """
+    while True:
+        yield from generate_passwords(batch_size, policy)
+
+
+if __name__ == "__main__":
+    from itertools import islice
+
+    # Policies that could never be met are rejected up front
+    for classes in [('ab', ''), ()]:
+        try:
+            PasswordPolicy(length=3, character_classes=classes)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"PasswordPolicy accepted character classes {classes!r}")
+
+    for password in islice(iter_passwords(PasswordPolicy(length=16), batch_size=5), 5):
+        print(password)
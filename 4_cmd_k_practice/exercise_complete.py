@@ -1,4 +1,23 @@
-import random
+import secrets
+from functools import lru_cache
+from typing import Iterable, Iterator, Tuple
+
+# How many recent fast-doubling results (including intermediate steps) to keep
+FIBONACCI_CACHE_SIZE = 256
+
+# Only pairs below this index are cached. F(n) has about 0.69n bits, so an entry
+# is at most ~0.8 KB and a full cache stays around 0.2 MB; larger pairs grow
+# with n and are recomputed instead of being kept alive.
+FIBONACCI_CACHE_MAX_INDEX = 4096
+
+# Greeting per language code, built once rather than on every greet() call
+GREETINGS = {
+    'en': 'Hello',
+    'es': 'Hola',
+    'fr': 'Bonjour',
+    'de': 'Hallo',
+    'it': 'Ciao'
+}
 
 def greet(*names, language='en'):
     """
@@ -11,15 +30,7 @@ def greet(*names, language='en'):
     Returns:
     A greeting string in the specified language.
     """
-    greetings = {
-        'en': 'Hello',
-        'es': 'Hola',
-        'fr': 'Bonjour',
-        'de': 'Hallo',
-        'it': 'Ciao'
-    }
-    
-    greeting = greetings.get(language.lower(), greetings['en'])
+    greeting = GREETINGS.get(language.lower(), GREETINGS['en'])
     
     if not names:
         return f"{greeting}!"
@@ -48,7 +59,8 @@ def calculate_area(length: float, width: float) -> float:
 
 def generate_password(length: int = 8) -> str:
     """
-    Generate a random password of given length.
+    Generate a random password of given length using a cryptographically
+    secure random source. See bulk_passwords.py for generating many at once.
     
     Args:
     length (int): The length of the password (default: 8).
@@ -64,21 +76,46 @@ def generate_password(length: int = 8) -> str:
     all_characters = lowercase + uppercase + digits + special
 
     password = [
-        random.choice(lowercase),
-        random.choice(uppercase),
-        random.choice(digits),
-        random.choice(special)
+        secrets.choice(lowercase),
+        secrets.choice(uppercase),
+        secrets.choice(digits),
+        secrets.choice(special)
     ]
 
     for _ in range(length - 4):
-        password.append(random.choice(all_characters))
+        password.append(secrets.choice(all_characters))
 
-    random.shuffle(password)
+    secrets.SystemRandom().shuffle(password)
     return ''.join(password)
 
+def _fibonacci_pair(n: int) -> Tuple[int, int]:
+    """
+    Return (F(n), F(n + 1)) using the fast-doubling identities
+    F(2k) = F(k) * (2F(k + 1) - F(k)) and F(2k + 1) = F(k)^2 + F(k + 1)^2.
+    """
+    if n == 0:
+        return 0, 1
+    a, b = _lookup_fibonacci_pair(n >> 1)
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    if n & 1:
+        return d, c + d
+    return c, d
+
+_cached_fibonacci_pair = lru_cache(maxsize=FIBONACCI_CACHE_SIZE)(_fibonacci_pair)
+
+def _lookup_fibonacci_pair(n: int) -> Tuple[int, int]:
+    if n < FIBONACCI_CACHE_MAX_INDEX:
+        return _cached_fibonacci_pair(n)
+    return _fibonacci_pair(n)
+
 def fibonacci(n: int) -> int:
     """
-    Return the nth Fibonacci number using dynamic programming.
+    Return the nth Fibonacci number using fast doubling in O(log n) steps.
+
+    Recent results for small indices are kept in a bounded LRU cache, so
+    repeated and nearby indices share their early steps without the cache
+    holding on to large numbers.
 
     Args:
     n (int): The position of the Fibonacci number to calculate.
@@ -91,16 +128,49 @@ def fibonacci(n: int) -> int:
     """
     if n < 0:
         raise ValueError("n must be a non-negative integer.")
-    if n <= 1:
-        return n
+    return _lookup_fibonacci_pair(n)[0]
+
+def fibonacci_batch(indices: Iterable[int]) -> Iterator[int]:
+    """
+    Yield the Fibonacci number for each index, in the order given.
+
+    Args:
+    indices (Iterable[int]): The positions to calculate.
+
+    Returns:
+    Iterator[int]: One Fibonacci number per index.
 
-    fib = [0] * (n + 1)
-    fib[1] = 1
+    Raises:
+    ValueError: If an index is negative.
+    """
+    for n in indices:
+        yield fibonacci(n)
+
+def fibonacci_range(start: int, stop: int) -> Iterator[int]:
+    """
+    Yield F(start), F(start + 1), ..., F(stop - 1).
 
-    for i in range(2, n + 1):
-        fib[i] = fib[i-1] + fib[i-2]
+    Only F(start) is calculated by fast doubling; each later number is a
+    single addition.
 
-    return fib[n]
+    Args:
+    start (int): The first position.
+    stop (int): The position after the last one.
+
+    Returns:
+    Iterator[int]: The Fibonacci numbers in the range.
+
+    Raises:
+    ValueError: If start is negative.
+    """
+    if start < 0:
+        raise ValueError("start must be a non-negative integer.")
+    if stop <= start:
+        return
+    a, b = _lookup_fibonacci_pair(start)
+    for _ in range(start, stop):
+        yield a
+        a, b = b, a + b
     
 
 def main():
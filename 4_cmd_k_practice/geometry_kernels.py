@@ -0,0 +1,54 @@
+import numpy as np
+from numpy.typing import ArrayLike
+
+# How many offending positions a validation error lists
+MAX_REPORTED = 5
+
+
+def check_non_negative(name: str, values: np.ndarray) -> None:
+    """
+    Raise a ValueError describing every negative entry in one vectorised pass.
+
+    Args:
+    name (str): What the values are, used in the error message.
+    values (np.ndarray): The values to check.
+
+    Raises:
+    ValueError: If any value is negative; the message gives the count and the
+        first few indices with their values.
+    """
+    negative = np.flatnonzero(values < 0)
+    if negative.size:
+        shown = ", ".join(f"{i} ({values.flat[i]})" for i in negative[:MAX_REPORTED])
+        more = f" and {negative.size - MAX_REPORTED} more" if negative.size > MAX_REPORTED else ""
+        raise ValueError(f"{name} must be non-negative; {negative.size} negative value(s) at indices {shown}{more}.")
+
+
+def calculate_areas(lengths: ArrayLike, widths: ArrayLike) -> np.ndarray:
+    """
+    Calculate the areas of many rectangles at once.
+
+    Args:
+    lengths (array-like): The length of each rectangle.
+    widths (array-like): The width of each rectangle (same shape as lengths,
+        or broadcastable to it).
+
+    Returns:
+    np.ndarray: The area of each rectangle.
+
+    Raises:
+    ValueError: If any length or width is negative.
+    """
+    lengths = np.asarray(lengths, dtype=np.float64)
+    widths = np.asarray(widths, dtype=np.float64)
+    check_non_negative("Lengths", lengths)
+    check_non_negative("Widths", widths)
+    return lengths * widths
+
+
+if __name__ == "__main__":
+    print(calculate_areas([5, 2.5, 0], [3, 4, 10]))
+    try:
+        calculate_areas([1, -2, 3, -4], [1, 1, 1, 1])
+    except ValueError as e:
+        print(e)
@@ -0,0 +1,91 @@
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from exercise_complete import GREETINGS
+
+# A recipient is one name or a group of names greeted together
+Recipient = Union[str, Sequence[str]]
+
+# (greeting with no names, prefix before the names, text between the last two names)
+Template = Tuple[str, str, str]
+
+
+class GreetingRenderer:
+    """
+    Renders greet()-style messages for many recipients.
+
+    Locale tables are loaded once when the renderer is created, and each
+    language's template is built the first time it is used and then reused.
+    """
+
+    def __init__(self, greetings: Optional[Dict[str, str]] = None, default_language: str = 'en'):
+        self._greetings = dict(GREETINGS if greetings is None else greetings)
+        self._conjunctions: Dict[str, str] = {}
+        self._templates: Dict[str, Template] = {}
+        if default_language not in self._greetings:
+            raise ValueError(f"No greeting for default language {default_language!r}.")
+        self.default_language = default_language
+
+    def register(self, language: str, greeting: str, conjunction: str = 'and') -> None:
+        """
+        Add or replace a language.
+
+        Args:
+        language (str): The language code, e.g. 'pt'.
+        greeting (str): The greeting word, e.g. 'Olá'.
+        conjunction (str): The word joining the last two names (default: 'and', as greet() uses).
+        """
+        language = language.lower()
+        self._greetings[language] = greeting
+        self._conjunctions[language] = conjunction
+        # Unknown languages may have cached the default template, so rebuild all
+        self._templates.clear()
+
+    def _template(self, language: str) -> Template:
+        language = language.lower()
+        template = self._templates.get(language)
+        if template is None:
+            code = language if language in self._greetings else self.default_language
+            greeting = self._greetings[code]
+            template = (f"{greeting}!", f"{greeting}, ", f" {self._conjunctions.get(code, 'and')} ")
+            self._templates[language] = template
+        return template
+
+    def render(self, names: Sequence[str], language: str = 'en') -> str:
+        """
+        Render one greeting; the output matches greet(*names, language=language).
+        """
+        no_names, prefix, conjunction = self._template(language)
+        if not names:
+            return no_names
+        if len(names) == 1:
+            return prefix + names[0] + "!"
+        return prefix + ", ".join(names[:-1]) + conjunction + names[-1] + "!"
+
+    def render_many(self, recipients: Iterable[Recipient], language: str = 'en') -> Iterator[str]:
+        """
+        Yield one greeting per recipient, in order.
+
+        Args:
+        recipients (Iterable): Names, or sequences of names to greet together.
+        language (str): The language code for every greeting.
+
+        Returns:
+        Iterator[str]: The rendered greetings.
+        """
+        no_names, prefix, conjunction = self._template(language)
+        for recipient in recipients:
+            if isinstance(recipient, str):
+                yield prefix + recipient + "!"
+            elif not recipient:
+                yield no_names
+            elif len(recipient) == 1:
+                yield prefix + recipient[0] + "!"
+            else:
+                yield prefix + ", ".join(recipient[:-1]) + conjunction + recipient[-1] + "!"
+
+
+if __name__ == "__main__":
+    renderer = GreetingRenderer()
+    renderer.register('pt', 'Olá', conjunction='e')
+    for message in renderer.render_many(["Alice", ("Bob", "Carol"), ("Dan", "Eve", "Frank")], language='pt'):
+        print(message)
@@ -0,0 +1,889 @@
+import argparse
+import cProfile
+import fnmatch
+import functools
+import gzip
+import importlib
+import io
+import json
+import os
+import platform
+import pstats
+import shutil
+import statistics
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Benchmarks every public function of the Python exercises at several input
+# sizes. Run from anywhere:
+#
+#     python benchmarks/run_benchmarks.py --save before
+#     ... change something ...
+#     python benchmarks/run_benchmarks.py --compare before
+#
+# Results are stored as JSON in benchmarks/results/<name>.json.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE_DIRS = [
+    os.path.join(ROOT, '3_understanding_cursors_autocomplete (tab completion)'),
+    os.path.join(ROOT, '4_cmd_k_practice'),
+]
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# A case is timed for at least this long in total
+MIN_TIME = 0.2
+REPEAT = 5
+
+# The modules import their siblings by name, so their directories go on the path
+for directory in MODULE_DIRS:
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+Setup = Callable[[int], Callable[[], object]]
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Setup
+    sizes: Tuple[int, ...]
+
+
+@dataclass
+class Result:
+    """
+    Timings for one case at one size. Seconds are per call.
+    """
+    case: str
+    size: int
+    best: float
+    median: float
+    calls: int
+    peak_bytes: Optional[int] = None
+    error: Optional[str] = None
+    # True when the error is a missing dependency rather than a failure of the code
+    skipped: bool = False
+
+    @property
+    def key(self) -> str:
+        return f"{self.case}[{self.size}]"
+
+
+CASES: List[Case] = []
+
+# Scratch directories made by setups, removed once their case has run
+_SCRATCH_DIRS: List[str] = []
+
+
+def benchmark(name: str, sizes: Tuple[int, ...]) -> Callable[[Setup], Setup]:
+    """
+    Registers a setup function. It is called with each size, builds its input
+    outside the timed region and returns the zero-argument callable to time.
+    """
+    def register(setup: Setup) -> Setup:
+        CASES.append(Case(name, setup, sizes))
+        return setup
+    return register
+
+
+def _scratch_dir() -> str:
+    directory = tempfile.mkdtemp(prefix='benchmarks-')
+    _SCRATCH_DIRS.append(directory)
+    return directory
+
+
+def _remove_scratch_dirs() -> None:
+    while _SCRATCH_DIRS:
+        shutil.rmtree(_SCRATCH_DIRS.pop(), ignore_errors=True)
+
+
+def _integers(size: int):
+    import numpy as np
+    return np.random.default_rng(0).integers(0, 1_000_000, size)
+
+
+def _weather(size: int):
+    import numpy as np
+    import pandas as pd # type: ignore
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'Date': pd.date_range('2023-01-01', periods=size, freq='h'),
+        'Temperature': rng.normal(30, 8, size),
+        'Humidity': rng.uniform(20, 100, size),
+        'Precipitation': rng.exponential(0.3, size),
+        'WindSpeed': rng.uniform(0, 30, size),
+        'Location': pd.Categorical(rng.choice(['City A', 'City B', 'City C'], size)),
+    })
+
+
+def _employees(size: int):
+    import numpy as np
+    import pandas as pd # type: ignore
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'Name': [f"Employee {i}" for i in range(size)],
+        'Age': rng.integers(20, 65, size),
+        'City': rng.choice(['New York', 'San Francisco', 'London', 'Paris', 'Tokyo'], size),
+        'Salary': rng.integers(30_000, 150_000, size),
+        'Experience': rng.integers(0, 40, size),
+        'Bonus': rng.integers(0, 10_000, size),
+        'Department': rng.choice(['HR', 'Engineering', 'Marketing', 'Sales', 'Finance'], size),
+    })
+
+
+def _birthdays(size: int):
+    import pandas as pd # type: ignore
+    return pd.Series(pd.to_datetime('1940-01-01') + pd.to_timedelta(_integers(size) % 30_000, unit='D'))
+
+
+def _log_file(size: int, compress: bool = False) -> str:
+    """
+    Writes `size` bytes of CSV-like log lines to a scratch file, gzipped if asked.
+    """
+    line = b"2023-01-01T00:00:00,City A,32.0,80.0,0.5,10.0\n"
+    contents = (line * (size // len(line) + 1))[:size]
+    path = os.path.join(_scratch_dir(), 'log.txt.gz' if compress else 'log.txt')
+    with gzip.open(path, 'wb', compresslevel=1) if compress else open(path, 'wb') as file:
+        file.write(contents)
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _stub_server() -> str:
+    """
+    Starts a local HTTP server that answers every GET at once, returning its base URL.
+    """
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body are separate writes; without this, delayed ACKs stall each response
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            body = f"Data from {self.path}".encode()
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class StubServer(ThreadingHTTPServer):
+        # The default backlog of 5 makes bursts of connections wait on SYN retries
+        request_queue_size = 1024
+        daemon_threads = True
+
+    server = StubServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+# exercise_smart_rewrites_completed.py and its array-backed counterparts
+
+@benchmark('exercise_smart_rewrites_completed.filter_even_numbers', (1_000, 100_000, 1_000_000))
+def bench_rewrites_filter_even_numbers(size):
+    from exercise_smart_rewrites_completed import filter_even_numbers
+    numbers = _integers(size).tolist()
+    return lambda: filter_even_numbers(numbers)
+
+
+@benchmark('exercise_smart_rewrites_completed.create_square_dict', (1_000, 100_000, 1_000_000))
+def bench_rewrites_create_square_dict(size):
+    from exercise_smart_rewrites_completed import create_square_dict
+    numbers = _integers(size).tolist()
+    return lambda: create_square_dict(numbers)
+
+
+@benchmark('exercise_smart_rewrites_completed.find_first_even', (1_000, 100_000, 1_000_000))
+def bench_rewrites_find_first_even(size):
+    from exercise_smart_rewrites_completed import find_first_even
+    # Only the last number is even, so the whole list is scanned
+    numbers = (_integers(size) | 1).tolist()
+    numbers[-1] = 2
+    return lambda: find_first_even(numbers)
+
+
+@benchmark('exercise_smart_rewrites_completed.calculate_average', (1_000, 100_000, 1_000_000))
+def bench_rewrites_calculate_average(size):
+    from exercise_smart_rewrites_completed import calculate_average
+    numbers = _integers(size).tolist()
+    return lambda: calculate_average(numbers)
+
+
+@benchmark('exercise_smart_rewrites_completed.concatenate_strings', (10, 1_000, 100_000))
+def bench_rewrites_concatenate_strings(size):
+    from exercise_smart_rewrites_completed import concatenate_strings
+    words = [f"word{i}" for i in range(size)]
+    return lambda: concatenate_strings(", ", *words)
+
+
+@benchmark('exercise_smart_rewrites_completed.Rectangle.from_area', (1_000, 100_000))
+def bench_rewrites_rectangle_from_area(size):
+    from exercise_smart_rewrites_completed import Rectangle
+    areas = _integers(size).tolist()
+    return lambda: [Rectangle.from_area(area).area() for area in areas]
+
+
+@benchmark('exercise_smart_rewrites_completed.multiply_by_two', (1_000, 100_000))
+def bench_rewrites_multiply_by_two(size):
+    from exercise_smart_rewrites_completed import multiply_by_two
+    numbers = _integers(size).tolist()
+    return lambda: [multiply_by_two(number) for number in numbers]
+
+
+@benchmark('exercise_smart_rewrites_completed.calculate_circle_area', (1_000, 100_000))
+def bench_rewrites_calculate_circle_area(size):
+    from exercise_smart_rewrites_completed import calculate_circle_area
+    radii = _integers(size).tolist()
+    return lambda: [calculate_circle_area(radius) for radius in radii]
+
+
+@benchmark('exercise_smart_rewrites_completed.greet', (1_000, 100_000))
+def bench_rewrites_greet(size):
+    from exercise_smart_rewrites_completed import greet
+    names = [f"Person {i}" for i in range(size)]
+    return lambda: [greet(name, i % 90) for i, name in enumerate(names)]
+
+
+@benchmark('exercise_smart_rewrites_completed.Person', (1_000, 100_000))
+def bench_rewrites_person(size):
+    from exercise_smart_rewrites_completed import Person
+    names = [f"Person {i}" for i in range(size)]
+    return lambda: [str(Person(name, i % 90)) for i, name in enumerate(names)]
+
+
+@benchmark('exercise_smart_rewrites_completed.Car', (1_000, 100_000))
+def bench_rewrites_car(size):
+    from exercise_smart_rewrites_completed import Car
+    return lambda: [Car("Toyota", "Camry", 2000 + i % 25).display_info() for i in range(size)]
+
+
+@benchmark('exercise_smart_rewrites_completed.BankAccount', (1_000, 100_000))
+def bench_rewrites_bankaccount(size):
+    from exercise_smart_rewrites_completed import BankAccount
+    # Only construction and reads: the original balance setter recurses forever
+    return lambda: [BankAccount(i).balance for i in range(size)]
+
+
+@benchmark('exercise_smart_rewrites_completed.fetch_data', (1, 1_000))
+def bench_rewrites_fetch_data(size):
+    import asyncio
+    from exercise_smart_rewrites_completed import fetch_data
+    urls = [f"https://api.example.com/data/{i}" for i in range(size)]
+
+    async def fetch_all():
+        return await asyncio.gather(*(fetch_data(url) for url in urls))
+    return lambda: asyncio.run(fetch_all())
+
+
+@benchmark('array_kernels.filter_even_numbers', (1_000, 1_000_000, 10_000_000))
+def bench_array_kernels_filter_even_numbers(size):
+    from array_kernels import filter_even_numbers
+    numbers = _integers(size)
+    return lambda: filter_even_numbers(numbers)
+
+
+@benchmark('array_kernels.square_table', (1_000, 1_000_000, 10_000_000))
+def bench_array_kernels_square_table(size):
+    from array_kernels import square_table
+    numbers = _integers(size)
+    return lambda: square_table(numbers)
+
+
+@benchmark('array_kernels.find_first_even', (1_000, 1_000_000, 10_000_000))
+def bench_array_kernels_find_first_even(size):
+    from array_kernels import find_first_even
+    numbers = _integers(size) | 1
+    numbers[-1] = 2
+    return lambda: find_first_even(numbers)
+
+
+@benchmark('array_kernels.calculate_average', (1_000, 1_000_000, 10_000_000))
+def bench_array_kernels_calculate_average(size):
+    from array_kernels import calculate_average
+    numbers = _integers(size)
+    return lambda: calculate_average(numbers)
+
+
+@benchmark('streaming_stats.StreamingStats.update_many', (1_000, 1_000_000, 10_000_000))
+def bench_streaming_stats_streamingstats_update_many(size):
+    from streaming_stats import StreamingStats
+    numbers = _integers(size)
+    return lambda: StreamingStats().update_many(numbers)
+
+
+@benchmark('rectangle_batch.RectangleBatch.from_areas', (1_000, 100_000, 10_000_000))
+def bench_rectangle_batch_rectanglebatch_from_areas(size):
+    from rectangle_batch import RectangleBatch
+    areas = _integers(size).astype(float)
+    return lambda: RectangleBatch.from_areas(areas).area()
+
+
+@benchmark('compact_records.PersonColumns', (1_000, 100_000))
+def bench_compact_records_personcolumns(size):
+    from compact_records import PersonColumns
+    names = [f"Person {i}" for i in range(size)]
+
+    def build():
+        columns = PersonColumns()
+        for i, name in enumerate(names):
+            columns.append(name, i % 90)
+        return columns
+    return build
+
+
+@benchmark('compact_records.CompactPerson', (1_000, 100_000))
+def bench_compact_records_compactperson(size):
+    from compact_records import CompactPerson
+    names = [f"Person {i}" for i in range(size)]
+    return lambda: [str(CompactPerson(name, i % 90)) for i, name in enumerate(names)]
+
+
+@benchmark('compact_records.CompactCar', (1_000, 100_000))
+def bench_compact_records_compactcar(size):
+    from compact_records import CompactCar
+    return lambda: [CompactCar("Toyota", "Camry", 2000 + i % 25).display_info() for i in range(size)]
+
+
+@benchmark('compact_records.CompactBankAccount', (1_000, 100_000))
+def bench_compact_records_compactbankaccount(size):
+    from compact_records import CompactBankAccount
+
+    def run():
+        for i in range(size):
+            account = CompactBankAccount(i)
+            account.balance = account.balance + 1
+    return run
+
+
+# function_declarations.py and calendar_masks.py
+
+@benchmark('function_declarations.calculate_todays_date_versus_birthday', (1_000, 100_000))
+def bench_declarations_calculate_todays_date_versus_birthday(size):
+    from function_declarations import calculate_todays_date_versus_birthday, is_in_certain_age_range
+    birthdays = _birthdays(size).tolist()
+    ages = (_integers(size) % 100).tolist()
+    return lambda: [
+        calculate_todays_date_versus_birthday(birthday) and is_in_certain_age_range(age)
+        for birthday, age in zip(birthdays, ages)
+    ]
+
+
+@benchmark('calendar_masks.birthday_mask', (1_000, 100_000, 5_000_000))
+def bench_calendar_masks_birthday_mask(size):
+    from calendar_masks import age_range_mask, birthday_mask
+    birthdays = _birthdays(size)
+    ages = _integers(size) % 100
+    return lambda: birthday_mask(birthdays) & age_range_mask(ages)
+
+
+@benchmark('function_declarations.is_in_certain_month', (1_000, 100_000))
+def bench_declarations_is_in_certain_month(size):
+    from function_declarations import is_in_certain_month
+    months = (_integers(size) % 14).tolist()
+    return lambda: [is_in_certain_month(month) for month in months]
+
+
+@benchmark('function_declarations.is_in_certain_day_of_week', (1_000, 100_000))
+def bench_declarations_is_in_certain_day_of_week(size):
+    from function_declarations import is_in_certain_day_of_week
+    days = (_integers(size) % 9).tolist()
+    return lambda: [is_in_certain_day_of_week(day) for day in days]
+
+
+@benchmark('function_declarations.is_in_certain_hour', (1_000, 100_000))
+def bench_declarations_is_in_certain_hour(size):
+    from function_declarations import is_in_certain_hour
+    hours = (_integers(size) % 26).tolist()
+    return lambda: [is_in_certain_hour(hour) for hour in hours]
+
+
+@benchmark('calendar_masks.month_mask', (1_000, 100_000, 5_000_000))
+def bench_calendar_masks_month_mask(size):
+    from calendar_masks import month_mask
+    months = _integers(size) % 14
+    return lambda: month_mask(months)
+
+
+@benchmark('calendar_masks.day_of_week_mask', (1_000, 100_000, 5_000_000))
+def bench_calendar_masks_day_of_week_mask(size):
+    from calendar_masks import day_of_week_mask
+    days = _integers(size) % 9
+    return lambda: day_of_week_mask(days)
+
+
+@benchmark('calendar_masks.hour_mask', (1_000, 100_000, 5_000_000))
+def bench_calendar_masks_hour_mask(size):
+    from calendar_masks import hour_mask
+    hours = _integers(size) % 26
+    return lambda: hour_mask(hours)
+
+
+@benchmark('calendar_masks.month_and_day', (1_000, 100_000, 5_000_000))
+def bench_calendar_masks_month_and_day(size):
+    from calendar_masks import month_and_day
+    birthdays = _birthdays(size)
+    return lambda: month_and_day(birthdays)
+
+
+# Reading files: read_file_contents and file_access.py (sizes in bytes)
+
+@benchmark('exercise_smart_rewrites_completed.read_file_contents', (1 << 20, 1 << 24, 1 << 26))
+def bench_rewrites_read_file_contents(size):
+    from exercise_smart_rewrites_completed import read_file_contents
+    path = _log_file(size)
+    return lambda: read_file_contents(path)
+
+
+@benchmark('file_access.iter_chunks', (1 << 20, 1 << 24, 1 << 26))
+def bench_file_access_iter_chunks(size):
+    from file_access import iter_chunks
+    path = _log_file(size)
+    return lambda: sum(len(chunk) for chunk in iter_chunks(path))
+
+
+@benchmark('file_access.iter_chunks (gzip)', (1 << 20, 1 << 24, 1 << 26))
+def bench_file_access_iter_chunks_gzip(size):
+    from file_access import iter_chunks
+    path = _log_file(size, compress=True)
+    return lambda: sum(len(chunk) for chunk in iter_chunks(path))
+
+
+@benchmark('file_access.iter_lines', (1 << 20, 1 << 24, 1 << 26))
+def bench_file_access_iter_lines(size):
+    from file_access import iter_lines
+    path = _log_file(size)
+    return lambda: sum(1 for _ in iter_lines(path))
+
+
+@benchmark('file_access.mapped', (1 << 20, 1 << 24, 1 << 26))
+def bench_file_access_mapped(size):
+    import zlib
+    from file_access import mapped
+    path = _log_file(size)
+
+    def run():
+        with mapped(path) as view:
+            return zlib.crc32(view)
+    return run
+
+
+@benchmark('file_access.iter_mapped_chunks', (1 << 20, 1 << 24, 1 << 26))
+def bench_file_access_iter_mapped_chunks(size):
+    import zlib
+    from file_access import iter_mapped_chunks
+    path = _log_file(size)
+
+    def run():
+        crc = 0
+        for chunk in iter_mapped_chunks(path):
+            crc = zlib.crc32(chunk, crc)
+        return crc
+    return run
+
+
+@benchmark('file_access.is_gzip', (1, 1_000))
+def bench_file_access_is_gzip(size):
+    from file_access import is_gzip
+    path = _log_file(1 << 10)
+    return lambda: [is_gzip(path) for _ in range(size)]
+
+
+# async_fetcher.py against a local stub server (sizes are URLs per batch)
+
+@benchmark('async_fetcher.ConcurrentFetcher.fetch_many', (10, 100, 1_000))
+def bench_async_fetcher_concurrentfetcher_fetch_many(size):
+    import asyncio
+    from async_fetcher import ConcurrentFetcher
+    urls = [f"{_stub_server()}/data/{i}" for i in range(size)]
+
+    async def fetch_all():
+        async with ConcurrentFetcher(max_concurrency=32, per_host_limit=32, cache_ttl=0) as fetcher:
+            return await fetcher.fetch_many(urls)
+    return lambda: asyncio.run(fetch_all())
+
+
+@benchmark('async_fetcher.TTLCache', (1_000, 100_000))
+def bench_async_fetcher_ttlcache(size):
+    from async_fetcher import FetchResult, TTLCache
+    urls = [f"https://api.example.com/data/{i}" for i in range(size)]
+    result = FetchResult(urls[0], 200, "Data", 0.0, 1)
+
+    def run():
+        cache = TTLCache(ttl=60, max_entries=size // 2)
+        for url in urls:
+            cache.set(url, result)
+        return sum(cache.get(url) is not None for url in urls)
+    return run
+
+
+# The pandas scripts
+
+@benchmark('exercise_weather_completed.analyse_weather', (10, 10_000, 1_000_000))
+def bench_weather_analyse_weather(size):
+    from exercise_weather_completed import analyse_weather, load_weather
+    path = os.path.join(_scratch_dir(), 'weather.parquet')
+    # The sample data has 10 rows; larger sizes use synthetic readings
+    df = load_weather() if size == 10 else _weather(size)
+    return lambda: analyse_weather(df, path)
+
+
+@benchmark('exercise_weather_completed.plot_temperature', (10, 1_000, 100_000))
+def bench_weather_plot_temperature(size):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from exercise_weather_completed import load_weather, plot_temperature
+    path = os.path.join(_scratch_dir(), 'temperature.png')
+    df = load_weather() if size == 10 else _weather(size)
+
+    def run():
+        plot_temperature(df, path)
+        plt.close('all')
+    return run
+
+
+@benchmark('columnar_storage.write_columnar', (10_000, 1_000_000))
+def bench_columnar_storage_write_columnar(size):
+    from columnar_storage import write_columnar
+    path = os.path.join(_scratch_dir(), 'weather.parquet')
+    df = _weather(size)
+    return lambda: write_columnar(df, path)
+
+
+@benchmark('weather_streaming.summarise_weather_file', (10_000, 1_000_000))
+def bench_weather_streaming_summarise_weather_file(size):
+    from columnar_storage import write_columnar
+    from weather_streaming import summarise_weather_file
+    path = os.path.join(_scratch_dir(), 'weather.parquet')
+    write_columnar(_weather(size), path)
+    return lambda: summarise_weather_file(path)
+
+
+@benchmark('weather_parallel.parallel_location_stats', (100_000, 1_000_000))
+def bench_weather_parallel_parallel_location_stats(size):
+    from weather_parallel import parallel_location_stats
+    df = _weather(size)
+    return lambda: parallel_location_stats(df)
+
+
+@benchmark('weather_timeseries.IncrementalWeatherSeries.append', (10_000, 100_000))
+def bench_weather_timeseries_incrementalweatherseries_append(size):
+    from weather_timeseries import IncrementalWeatherSeries
+    df = _weather(size)
+    return lambda: IncrementalWeatherSeries().append(df)
+
+
+@benchmark('columnar_storage.read_columnar', (10_000, 1_000_000))
+def bench_columnar_storage_read_columnar(size):
+    from columnar_storage import read_columnar, write_columnar
+    path = os.path.join(_scratch_dir(), 'weather.parquet')
+    write_columnar(_weather(size), path)
+    return lambda: read_columnar(path, columns=['Temperature', 'Location'], filters=[('Location', '==', 'City A')])
+
+
+@benchmark('main_completed.load_employees', (5, 10_000, 1_000_000))
+def bench_main_load_employees(size):
+    import main_completed
+    path = os.path.join(_scratch_dir(), 'employees.parquet')
+    # load_employees always uses the module's `data`, so larger sizes swap in
+    # synthetic employees for the duration of each call
+    data = main_completed.data if size == 5 else _employees(size).to_dict('list')
+
+    def run():
+        original = main_completed.data
+        main_completed.data = data
+        try:
+            return main_completed.load_employees(path)
+        finally:
+            main_completed.data = original
+    return run
+
+
+@benchmark('employee_query.summarise_employees', (1_000, 100_000, 1_000_000))
+def bench_employee_query_summarise_employees(size):
+    from employee_query import summarise_employees
+    df = _employees(size)
+    return lambda: summarise_employees(df)
+
+
+# exercise_complete.py and its batch counterparts
+
+@benchmark('exercise_complete.fibonacci', (100, 10_000, 1_000_000))
+def bench_exercise_fibonacci(size):
+    import exercise_complete
+
+    def run():
+        exercise_complete._cached_fibonacci_pair.cache_clear()
+        return exercise_complete.fibonacci(size)
+    return run
+
+
+@benchmark('exercise_complete.fibonacci_batch', (100, 10_000))
+def bench_exercise_fibonacci_batch(size):
+    import exercise_complete
+    indices = (_integers(size) % 10_000).tolist()
+
+    def run():
+        exercise_complete._cached_fibonacci_pair.cache_clear()
+        return list(exercise_complete.fibonacci_batch(indices))
+    return run
+
+
+@benchmark('exercise_complete.fibonacci_range', (1_000, 10_000))
+def bench_exercise_fibonacci_range(size):
+    from exercise_complete import fibonacci_range
+    return lambda: sum(1 for _ in fibonacci_range(0, size))
+
+
+@benchmark('exercise_complete.greet', (1_000, 100_000))
+def bench_exercise_greet(size):
+    from exercise_complete import greet
+    names = [f"Person {i}" for i in range(size)]
+    return lambda: [greet(name, language='fr') for name in names]
+
+
+@benchmark('greeting_renderer.GreetingRenderer.render_many', (1_000, 100_000))
+def bench_greeting_renderer_greetingrenderer_render_many(size):
+    from greeting_renderer import GreetingRenderer
+    names = [f"Person {i}" for i in range(size)]
+    return lambda: list(GreetingRenderer().render_many(names, language='fr'))
+
+
+@benchmark('greeting_renderer.GreetingRenderer.render', (1_000, 100_000))
+def bench_greeting_renderer_greetingrenderer_render(size):
+    from greeting_renderer import GreetingRenderer
+    renderer = GreetingRenderer()
+    groups = [(f"Person {i}", f"Friend {i}") for i in range(size)]
+    return lambda: [renderer.render(group, language='fr') for group in groups]
+
+
+@benchmark('exercise_complete.calculate_area', (1_000, 100_000))
+def bench_exercise_calculate_area(size):
+    from exercise_complete import calculate_area
+    lengths = _integers(size).tolist()
+    return lambda: [calculate_area(length, 2.0) for length in lengths]
+
+
+@benchmark('geometry_kernels.calculate_areas', (1_000, 100_000, 10_000_000))
+def bench_geometry_kernels_calculate_areas(size):
+    from geometry_kernels import calculate_areas
+    lengths = _integers(size).astype(float)
+    return lambda: calculate_areas(lengths, lengths)
+
+
+@benchmark('exercise_complete.generate_password', (1_000, 10_000))
+def bench_exercise_generate_password(size):
+    from exercise_complete import generate_password
+    return lambda: [generate_password(12) for _ in range(size)]
+
+
+@benchmark('bulk_passwords.generate_passwords', (1_000, 10_000, 1_000_000))
+def bench_bulk_passwords_generate_passwords(size):
+    from bulk_passwords import PasswordPolicy, generate_passwords
+    policy = PasswordPolicy(length=12)
+    return lambda: generate_passwords(size, policy)
+
+
+@benchmark('bulk_passwords.iter_passwords', (1_000, 100_000))
+def bench_bulk_passwords_iter_passwords(size):
+    from itertools import islice
+    from bulk_passwords import PasswordPolicy, iter_passwords
+    policy = PasswordPolicy(length=12)
+    return lambda: list(islice(iter_passwords(policy), size))
+
+
+def select_cases(patterns: List[str], max_size: Optional[int]) -> List[Tuple[Case, int]]:
+    """
+    Returns (case, size) pairs whose names match any of the glob patterns
+    (or all cases if there are none), skipping sizes above max_size.
+    """
+    selected = []
+    for case in CASES:
+        if patterns and not any(fnmatch.fnmatch(case.name, pattern) for pattern in patterns):
+            continue
+        for size in case.sizes:
+            if max_size is None or size <= max_size:
+                selected.append((case, size))
+    return selected
+
+
+def time_call(func: Callable[[], object]) -> Tuple[float, float, int]:
+    """
+    Times func like timeit: enough calls per round to take MIN_TIME, over REPEAT rounds.
+
+    Returns:
+    Tuple[float, float, int]: The best and median seconds per call, and calls per round.
+    """
+    timer = timeit.Timer(func)
+    calls, elapsed = timer.autorange()
+    if elapsed < MIN_TIME:
+        calls = max(1, int(calls * MIN_TIME / elapsed))
+    rounds = [total / calls for total in timer.repeat(repeat=REPEAT, number=calls)]
+    return min(rounds), statistics.median(rounds), calls
+
+
+def run_case(case: Case, size: int, memory: bool = False, profile_dir: Optional[str] = None) -> Result:
+    """
+    Sets up and times one case. A missing dependency marks the result as
+    skipped; any other exception is recorded as its error. Neither is raised,
+    and any scratch files the setup wrote are removed afterwards.
+
+    Args:
+    case (Case): The case to run.
+    size (int): The input size.
+    memory (bool): Also record the peak memory allocated by one call (via tracemalloc).
+    profile_dir (str, optional): If given, profile one call with cProfile and
+        save the stats there as <case>[<size>].prof.
+    """
+    try:
+        return _run_case(case, size, memory, profile_dir)
+    finally:
+        _remove_scratch_dirs()
+
+
+def _run_case(case: Case, size: int, memory: bool, profile_dir: Optional[str]) -> Result:
+    try:
+        func = case.setup(size)
+    except ImportError as e:
+        return Result(case.name, size, 0.0, 0.0, 0, error=f"{type(e).__name__}: {e}", skipped=True)
+    except Exception as e:
+        return Result(case.name, size, 0.0, 0.0, 0, error=f"{type(e).__name__}: {e}")
+    try:
+        best, median, calls = time_call(func)
+    except Exception as e:
+        return Result(case.name, size, 0.0, 0.0, 0, error=f"{type(e).__name__}: {e}")
+    result = Result(case.name, size, best, median, calls)
+    if memory:
+        tracemalloc.start()
+        try:
+            func()
+            result.peak_bytes = tracemalloc.get_traced_memory()[1]
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        finally:
+            tracemalloc.stop()
+    if profile_dir is not None and result.error is None:
+        profiler = cProfile.Profile()
+        profiler.runcall(func)
+        profiler.dump_stats(os.path.join(profile_dir, f"{result.key}.prof"))
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats('cumulative').print_stats(8)
+        print(output.getvalue())
+    return result
+
+
+def environment() -> Dict[str, str]:
+    """
+    Describes the interpreter and libraries, stored alongside results.
+    """
+    info = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': str(os.cpu_count()),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+    }
+    for package in ('numpy', 'pandas', 'pyarrow'):
+        try:
+            info[package] = importlib.import_module(package).__version__
+        except ImportError:
+            pass
+    return info
+
+
+def save_results(name: str, results: List[Result]) -> str:
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"{name}.json")
+    with open(path, 'w') as file:
+        json.dump({'environment': environment(), 'results': [asdict(r) for r in results]}, file, indent=2)
+    return path
+
+
+def load_results(name: str) -> Dict[str, Result]:
+    """
+    Loads saved results by name (or path), keyed by case and size.
+
+    Raises:
+    FileNotFoundError: If no results were saved under that name.
+    """
+    path = name if name.endswith('.json') else os.path.join(RESULTS_DIR, f"{name}.json")
+    with open(path) as file:
+        stored = json.load(file)
+    results = [Result(**fields) for fields in stored['results']]
+    return {result.key: result for result in results}
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks for the Python exercises")
+    parser.add_argument('patterns', nargs='*', help="glob patterns for case names, e.g. 'array_kernels.*' (default: all)")
+    parser.add_argument('--list', action='store_true', help="list the cases and exit")
+    parser.add_argument('--max-size', type=int, help="skip input sizes above this")
+    parser.add_argument('--memory', action='store_true', help="record peak memory per call with tracemalloc")
+    parser.add_argument('--profile', metavar='DIR', help="save a cProfile of each case to DIR and print the top functions")
+    parser.add_argument('--save', metavar='NAME', help="save results as benchmarks/results/NAME.json")
+    parser.add_argument('--compare', metavar='NAME', help="compare against saved results")
+    parser.add_argument('--threshold', type=float, default=1.25, help="slowdown ratio flagged as a regression (default: 1.25)")
+    args = parser.parse_args()
+
+    selected = select_cases(args.patterns, args.max_size)
+    if args.list:
+        for case, size in selected:
+            print(f"{case.name}[{size}]")
+        sys.exit()
+    if not selected:
+        parser.error("no cases match")
+    baseline = load_results(args.compare) if args.compare else {}
+    if args.profile:
+        os.makedirs(args.profile, exist_ok=True)
+
+    results = []
+    regressions = []
+    errors = []
+    for case, size in selected:
+        result = run_case(case, size, args.memory, args.profile)
+        results.append(result)
+        line = f"{result.key:<72}"
+        previous = baseline.get(result.key)
+        if result.skipped:
+            print(f"{line} skipped ({result.error})")
+            continue
+        if result.error:
+            # A case that worked in the baseline and now fails is the worst regression
+            was_ok = previous is not None and previous.error is None
+            print(f"{line} ERROR ({result.error}){'  REGRESSION' if was_ok else ''}", flush=True)
+            errors.append(result.key)
+            continue
+        line += f" {format_seconds(result.best):>10} {format_seconds(result.median):>10}"
+        if result.peak_bytes is not None:
+            line += f" {result.peak_bytes / 1e6:>9.1f} MB"
+        if previous is not None and not previous.error:
+            ratio = result.best / previous.best
+            line += f"  x{ratio:.2f}"
+            if ratio > args.threshold:
+                line += "  REGRESSION"
+                regressions.append(result.key)
+        print(line, flush=True)
+
+    if args.save:
+        print(f"Saved results to {save_results(args.save, results)}")
+    if regressions:
+        print(f"{len(regressions)} regression(s) over x{args.threshold}: {', '.join(regressions)}")
+    if errors:
+        print(f"{len(errors)} case(s) failed: {', '.join(errors)}")
+    if regressions or errors:
+        sys.exit(1)
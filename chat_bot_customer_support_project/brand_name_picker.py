@@ -4,10 +4,29 @@
 
 import os
 import json
+import time
 import asyncio
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 from pydantic import BaseModel, Field, ValidationError
-from openai import AsyncOpenAI
+from openai import (
+    AsyncOpenAI,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
+
+MODEL = "gpt-4o-2024-08-06"
+
+# USD per million tokens, used to estimate what a poll costs
+MODEL_PRICING = {
+    "gpt-4o-2024-08-06": {"input": 2.50, "cached_input": 1.25, "output": 10.00},
+}
+
+# Retries are handled here (not inside the client) so that they can be counted
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 0.5
+RETRYABLE_ERRORS = (APIConnectionError, APITimeoutError, InternalServerError, RateLimitError)
 
 # Define our Pydantic models for the poll results
 class PollResult(BaseModel):
@@ -28,13 +47,136 @@ class TallyRequest(BaseModel):
 class TallyResponse(BaseModel):
     poll_results: List[PollResult] = Field(..., description="List of poll results sorted by count")
 
-async def tally_results(openai: AsyncOpenAI, brand_counts: Dict[str, int]) -> PollResults:
+# Models for per-call instrumentation and the per-poll report
+class CallMetrics(BaseModel):
+    """Usage, latency and outcome of a single model call"""
+    operation: str
+    model: str
+    persona: Optional[str] = None
+    started_at: float = 0.0
+    latency_seconds: float = 0.0
+    retries: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    refused: bool = False
+    error: Optional[str] = None
+    cost_usd: float = 0.0
+
+class PollReport(BaseModel):
+    """Aggregated metrics for one poll"""
+    calls: int
+    errors: int
+    refusals: int
+    retries: int
+    cache_hits: int
+    prompt_tokens: int
+    completion_tokens: int
+    cached_tokens: int
+    cache_hit_rate: float = Field(..., description="Share of prompt tokens served from the prompt cache")
+    total_cost_usd: float
+    wall_time_seconds: float
+    mean_latency_seconds: float
+    p95_latency_seconds: float
+    max_latency_seconds: float
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> float:
+    """Estimate the USD cost of a call from its token usage."""
+    pricing = MODEL_PRICING.get(model)
+    if pricing is None:
+        return 0.0
+    uncached_tokens = prompt_tokens - cached_tokens
+    return (
+        uncached_tokens * pricing["input"]
+        + cached_tokens * pricing["cached_input"]
+        + completion_tokens * pricing["output"]
+    ) / 1_000_000
+
+class PollMetrics:
+    """Collects CallMetrics for every model call made during a poll."""
+
+    def __init__(self):
+        self.calls: List[CallMetrics] = []
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+
+    def record(self, call: CallMetrics) -> None:
+        self.calls.append(call)
+
+    def report(self) -> PollReport:
+        latencies = sorted(call.latency_seconds for call in self.calls)
+        prompt_tokens = sum(call.prompt_tokens for call in self.calls)
+        cached_tokens = sum(call.cached_tokens for call in self.calls)
+        return PollReport(
+            calls=len(self.calls),
+            errors=sum(1 for call in self.calls if call.error is not None),
+            refusals=sum(1 for call in self.calls if call.refused),
+            retries=sum(call.retries for call in self.calls),
+            cache_hits=sum(1 for call in self.calls if call.cached_tokens > 0),
+            prompt_tokens=prompt_tokens,
+            completion_tokens=sum(call.completion_tokens for call in self.calls),
+            cached_tokens=cached_tokens,
+            cache_hit_rate=cached_tokens / prompt_tokens if prompt_tokens else 0.0,
+            total_cost_usd=sum(call.cost_usd for call in self.calls),
+            wall_time_seconds=time.perf_counter() - self._start,
+            mean_latency_seconds=sum(latencies) / len(latencies) if latencies else 0.0,
+            p95_latency_seconds=latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))] if latencies else 0.0,
+            max_latency_seconds=latencies[-1] if latencies else 0.0,
+        )
+
+    def export_trace(self, path: str) -> None:
+        """Write one JSON line per call, in the order the calls started."""
+        with open(path, "w") as f:
+            for call in sorted(self.calls, key=lambda c: c.started_at):
+                f.write(call.model_dump_json() + "\n")
+
+async def parse_with_metrics(
+    openai: AsyncOpenAI,
+    metrics: Optional[PollMetrics],
+    operation: str,
+    persona: Optional[str] = None,
+    **kwargs: Any,
+) -> Tuple[Any, CallMetrics]:
+    """Call the parse endpoint with retries, recording usage and latency for the call."""
+    call = CallMetrics(operation=operation, model=kwargs["model"], persona=persona, started_at=time.time())
+    start = time.perf_counter()
+    try:
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                completion = await openai.beta.chat.completions.parse(**kwargs)
+                break
+            except RETRYABLE_ERRORS:
+                if attempt == MAX_RETRIES:
+                    raise
+                call.retries += 1
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2 ** attempt)
+
+        usage = completion.usage
+        if usage is not None:
+            call.prompt_tokens = usage.prompt_tokens
+            call.completion_tokens = usage.completion_tokens
+            details = getattr(usage, "prompt_tokens_details", None)
+            call.cached_tokens = getattr(details, "cached_tokens", None) or 0
+            call.cost_usd = estimate_cost(call.model, call.prompt_tokens, call.completion_tokens, call.cached_tokens)
+        return completion, call
+    except Exception as e:
+        call.error = str(e)
+        raise
+    finally:
+        call.latency_seconds = time.perf_counter() - start
+        if metrics is not None:
+            metrics.record(call)
+
+async def tally_results(openai: AsyncOpenAI, brand_counts: Dict[str, int], metrics: Optional[PollMetrics] = None) -> PollResults:
     """Use the model to tally and sort the results using Structured Outputs."""
     try:
         tally_request = TallyRequest(brand_counts=brand_counts)
         
-        completion = await openai.beta.chat.completions.parse(
-            model="gpt-4o-2024-08-06",
+        completion, _ = await parse_with_metrics(
+            openai,
+            metrics,
+            "tally_results",
+            model=MODEL,
             messages=[
                 {"role": "system", "content": "You are a helpful assistant that tallies poll results."},
                 {"role": "user", "content": f"Please tally these poll results and sort them from highest to lowest count: {tally_request.model_dump_json()}"}
@@ -63,7 +205,7 @@ async def tally_results(openai: AsyncOpenAI, brand_counts: Dict[str, int]) -> Po
         poll_results.sort(key=lambda x: x.count, reverse=True)
         return PollResults(poll_results=poll_results)
 
-async def ask_persona(openai: AsyncOpenAI, persona: str, brand_names: List[str]) -> str:
+async def ask_persona(openai: AsyncOpenAI, persona: str, brand_names: List[str], metrics: Optional[PollMetrics] = None) -> str:
     """Ask a single persona to choose a brand from the list using Structured Outputs."""
     persona_prompt = (
         f"You are simulating the response of: {persona}\n"
@@ -73,8 +215,12 @@ async def ask_persona(openai: AsyncOpenAI, persona: str, brand_names: List[str])
     
     try:
         # Use parse method for structured output
-        completion = await openai.beta.chat.completions.parse(
-            model="gpt-4o-2024-08-06",
+        completion, call = await parse_with_metrics(
+            openai,
+            metrics,
+            "ask_persona",
+            persona=persona,
+            model=MODEL,
             messages=[
                 {"role": "system", "content": '''You are simulating a specific persona making a brand choice. Here is some information about the future product:
                  I have 2x feature ideas for my app
@@ -258,6 +404,7 @@ The core jobs to be done is managing lots of clients and doing great work for th
         
         # Handle refusal or other issues
         if hasattr(message, 'refusal'):
+            call.refused = bool(message.refusal)
             print(f"{persona} refused to choose: {message.refusal}")
             return "No choice"
             
@@ -287,14 +434,16 @@ async def main():
         # Fallback if Faker is not installed.
         fake_personas = [f"Freelance Social Media Marketer: Person {i+1}" for i in range(30)]
 
-    openai = AsyncOpenAI()
+    # Retries are made (and counted) by parse_with_metrics rather than the client
+    openai = AsyncOpenAI(max_retries=0)
+    metrics = PollMetrics()
     try:
         print(f"Making individual requests for {len(fake_personas)} personas...")
         
         # Create a list of tasks, one for each persona
         tasks = []
         for persona in fake_personas:
-            task = ask_persona(openai, persona, brand_names)
+            task = ask_persona(openai, persona, brand_names, metrics)
             tasks.append(task)
         
         # Gather the responses asynchronously
@@ -309,12 +458,18 @@ async def main():
         print("\nRaw brand counts:", brand_counts)
         
         # Use structured outputs to tally the results
-        structured_output = await tally_results(openai, brand_counts)
+        structured_output = await tally_results(openai, brand_counts, metrics)
         
         # Display results
         print("\nPoll Results:")
         print(structured_output.model_dump_json(indent=4))
 
+        # Display what the poll cost and where the time went
+        print("\nPoll Metrics:")
+        print(metrics.report().model_dump_json(indent=4))
+        metrics.export_trace("poll_trace.jsonl")
+        print("Per-call trace written to poll_trace.jsonl")
+
     except Exception as e:
         print("An error occurred during the API calls:")
         print(e)